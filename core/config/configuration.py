@@ -1,13 +1,8 @@
-from typing import Optional
-from core.config.environment_setup import EnvironmentSetup
-from core.util.logger import Logger
-from core.util.resources import Resources
-
 """
 Configuration helpers for the application.
 
 This module exposes:
-- _SafeConfig: a thin dict-like wrapper that logs accesses and warns/errors when keys are missing.
+- _SafeConfig: a thin mapping wrapper that logs accesses and warns/errors when keys are missing.
 - Config: a singleton accessor that loads application configuration via `EnvironmentSetup`
   and returns a `_SafeConfig` instance.
 
@@ -15,22 +10,66 @@ All configuration access is logged through `Logger` for visibility during debugg
 and runtime diagnostics.
 """
 
+import threading
+from collections.abc import MutableMapping
+from typing import Optional
+from core.config.environment_setup import EnvironmentSetup
+from core.enums.log_level import LogLevel
+from core.util.logger import Logger
+from core.util.resources import Resources
+
+_MISSING = object()
+
 
-class _SafeConfig(dict):
+class _SafeConfig(MutableMapping):
     """
     A dict-like configuration wrapper that logs accesses and warns when a key is missing.
 
     **Behavior:**
 
-    - If a key exists, the value is returned and a debug message is emitted.
+    - If a key exists, the value is returned and a debug message is emitted on the
+      first lookup.
     - If a key does not exist and no default is provided, an error is logged.
     - If a key does not exist and a default is provided, a warning is logged and the
       default value is returned.
 
-    This class subclasses ``dict``, so it can be used wherever a standard mapping
-    is expected.
+    Successful lookups are memoized per key, so repeated reads of the same key skip
+    the logging work. The memo is cleared whenever the underlying mapping mutates.
+
+    The values live in a plain ``dict`` wrapped by a ``__slots__`` instance. Being a
+    ``MutableMapping``, it can be used wherever a standard mapping is expected; all
+    mutating methods go through ``__setitem__``/``__delitem__``.
     """
 
+    __slots__ = ("_data", "_cache")
+
+    def __init__(self, data: Optional[dict] = None):
+        self._data = dict(data) if data is not None else {}
+        self._cache = {}
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+        self._cache.clear()
+
+    def __delitem__(self, key):
+        del self._data[key]
+        self._cache.clear()
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._data!r})"
+
     def get(self, key, default=None):
         """
         Retrieve a configuration value by key.
@@ -40,16 +79,23 @@ class _SafeConfig(dict):
                         If omitted (``None``), missing keys are logged as an error.
         :returns: The value for the key if present, otherwise the default.
         """
-        value = super().get(key, default)
-
-        if key in self:
-            Logger.debug(f"Retrieved key '{key}': {value!r}")
-        elif default is None:
+        hit = self._cache.get(key, _MISSING)
+        if hit is not _MISSING:
+            return hit
+
+        value = self._data.get(key, _MISSING)
+
+        if value is not _MISSING:
+            self._cache[key] = value
+            if Logger.is_enabled_for(LogLevel.DEBUG):
+                Logger.debug(f"Retrieved key '{key}': {value!r}")
+            return value
+        if default is None:
             Logger.error(f"Missing key '{key}' in configuration!")
-        else:
+        elif Logger.is_enabled_for(LogLevel.WARNING):
             Logger.warning(f"Key '{key}' not found, using default: {default!r}")
 
-        return value
+        return default
 
 
 class Config:
@@ -60,10 +106,17 @@ class Config:
     It automatically merges configuration sources (e.g. ``config.toml`` and ``.env`` files)
     in development mode.
 
+    Loading is guarded by a lock (double-checked), so concurrent first calls load
+    the configuration only once; once loaded, ``get()`` returns without locking.
+    Hot callers may also keep the returned object around instead of calling
+    ``Config.get()`` repeatedly.
+
     :cvar _instance: Cached :class:`_SafeConfig` instance used throughout the application.
+    :cvar _lock: Lock guarding the first load.
     """
 
     _instance: Optional[_SafeConfig] = None
+    _lock = threading.Lock()
 
     @classmethod
     def get(cls) -> _SafeConfig:
@@ -73,13 +126,19 @@ class Config:
         :returns: The singleton configuration object.
         :rtype: _SafeConfig
         """
-        if cls._instance is None:
-            environment = EnvironmentSetup()
-            loaded = environment.load()
-
-            # Ensure we return a SafeConfig
-            cls._instance = _SafeConfig(loaded) if not isinstance(loaded, _SafeConfig) else loaded
-            Resources.initialize(cls._instance)
-            Logger.debug("Loaded configuration")
+        instance = cls._instance
+        if instance is not None:
+            return instance
+
+        with cls._lock:
+            if cls._instance is None:
+                environment = EnvironmentSetup()
+                loaded = environment.load()
+
+                # Ensure we return a SafeConfig
+                instance = _SafeConfig(loaded) if not isinstance(loaded, _SafeConfig) else loaded
+                Resources.initialize(instance)
+                cls._instance = instance
+                Logger.debug("Loaded configuration")
 
         return cls._instance
@@ -15,10 +15,12 @@ The module also configures logging behavior based on loaded settings.
 """
 
 import os
+import re
 import sys
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any
-from dotenv import load_dotenv
+from dotenv import dotenv_values, load_dotenv
 
 from core.util.logger import Logger
 
@@ -28,7 +30,55 @@ try:
 except ImportError:
     import tomli as tomllib
 
-from core.util.validator import ConfigValidator
+from core.util.validator import ConfigValidator, BOOL_BY_VALUE
+
+
+@lru_cache(maxsize=8)
+def _parse_toml(path: str, mtime: float) -> dict[str, Any]:
+    """
+    Parse a TOML file, memoized on its path and modification time.
+
+    Parameters
+    ----------
+    path : str
+        Absolute path of the TOML file.
+    mtime : float
+        Modification time of the file; part of the cache key so edits are picked up.
+
+    Returns
+    -------
+    dict[str, Any]
+        Parsed TOML data. The returned dict is shared between callers and must
+        not be mutated.
+    """
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+@lru_cache(maxsize=8)
+def _flatten_toml(path: str, mtime: float) -> tuple[tuple[str, Any], ...]:
+    """
+    Flatten a TOML file into `SECTION_KEY` items, memoized on its path and mtime.
+
+    Parameters
+    ----------
+    path : str
+        Absolute path of the TOML file.
+    mtime : float
+        Modification time of the file; part of the cache key so edits are picked up.
+
+    Returns
+    -------
+    tuple[tuple[str, Any], ...]
+        Immutable sequence of `(SECTION_KEY, value)` pairs (e.g. `[app].name` → `APP_NAME`).
+    """
+    # Keys are interned so lookups with the (interned) literals used across the
+    # app match by identity instead of comparing string contents
+    return tuple(
+        (sys.intern(f"{section.upper()}_{key.upper()}"), value)
+        for section, values in _parse_toml(path, mtime).items()
+        for key, value in values.items()
+    )
 
 
 class EnvironmentSetup:
@@ -57,9 +107,10 @@ class EnvironmentSetup:
         Name or path of the TOML config file (default: "config.toml").
     """
 
-    def __init__(self, env_path: str = ".env", toml_path: str = "config.toml"):
-        self.validator = ConfigValidator()
+    # Keys whose values are treated as filesystem paths
+    _PATH_KEY_RE = re.compile(r"PATH|DIR|FILE")
 
+    def __init__(self, env_path: str = ".env", toml_path: str = "config.toml"):
         # Determine project root (works in both PyInstaller & dev)
         if hasattr(sys, "_MEIPASS"):
             # PyInstaller bundle
@@ -70,16 +121,22 @@ class EnvironmentSetup:
             self.project_root = Path.cwd().resolve()
             self.is_dev = True  # True is correct, but we disable dev mode for testing
 
-        self.toml_path = (self.project_root / toml_path).resolve()
-        self.env_path = (self.project_root / env_path).resolve()
+        # The root is already resolved, so joined paths need no further `resolve()`
+        self.toml_path = self.project_root / toml_path
+        self._env_name = env_path
 
         # Load TOML (always)
+        self._toml_mtime = 0.0
+        self._persistence_logging = False
+        self._app_name = None
         self.toml_data = self._load_toml()
 
         # Load .env only if running in dev mode
         self.env_loaded = False
+        self.env_keys: tuple[str, ...] = ()
         if self.is_dev and self.env_path.exists():
             load_dotenv(dotenv_path=self.env_path)
+            self.env_keys = tuple(map(sys.intern, dotenv_values(self.env_path)))
             self.env_loaded = True
             Logger.configure_from_env()
         elif self.is_dev:
@@ -88,6 +145,20 @@ class EnvironmentSetup:
             # Not in dev mode → use TOML-based logging
             self._configure_logging_from_toml()
 
+    @cached_property
+    def env_path(self) -> Path:
+        """Path of the `.env` file; only computed when running in development mode."""
+        return self.project_root / self._env_name
+
+    @cached_property
+    def validator(self) -> ConfigValidator:
+        """
+        Validator used by `_auto_cast`.
+
+        Created on first use, so production runs (no `.env` merge) never build it.
+        """
+        return ConfigValidator()
+
     def _configure_logging_from_toml(self):
         """
         Configure logging using TOML settings when not running in development mode.
@@ -102,13 +173,10 @@ class EnvironmentSetup:
         - The application name is passed via PERSISTENCE_LOGGING_TARGET_NAME.
         """
         if self.toml_data is not None:
-            persistence_logging = (
-                self.toml_data.get("logging", {}).get("persistence_logging", False)
-            )
-            if persistence_logging:
+            if self._persistence_logging:
                 os.environ["PERSISTENCE_LOGGING"] = "True"
-                app_name = self.toml_data.get("app", {}).get("name")
-                os.environ["PERSISTENCE_LOGGING_TARGET_NAME"] = app_name
+                if self._app_name:
+                    os.environ["PERSISTENCE_LOGGING_TARGET_NAME"] = self._app_name
         else:
             # Default: enable persistence logging
             os.environ["PERSISTENCE_LOGGING"] = "True"
@@ -119,15 +187,24 @@ class EnvironmentSetup:
         """
         Load and parse the TOML configuration file.
 
+        The parsed result is cached per (path, mtime), so constructing another
+        `EnvironmentSetup` for an unchanged file does not parse it again.
+        The logging-related values are extracted here as well, so
+        `_configure_logging_from_toml` only reads attributes.
+
         Returns
         -------
         dict[str, Any] | None
             Parsed TOML data, or None if the file does not exist.
         """
-        if not self.toml_path.exists():
+        try:
+            self._toml_mtime = self.toml_path.stat().st_mtime
+        except FileNotFoundError:
             return None
-        with open(self.toml_path, "rb") as f:
-            return tomllib.load(f)
+        data = _parse_toml(str(self.toml_path), self._toml_mtime)
+        self._persistence_logging = data.get("logging", {}).get("persistence_logging", False)
+        self._app_name = data.get("app", {}).get("name")
+        return data
 
     def _auto_cast(self, key: str, value: str) -> Any:
         """
@@ -139,9 +216,13 @@ class EnvironmentSetup:
             * THEME_MODE → parsed using validator.parse_theme_mode
         - Boolean (true/false strings)
         - Positive integer
-        - File or directory path (absolute, validated, directories created if needed)
+        - File or directory path (absolute, validated, directories created if needed);
+          only for values starting with `/`, `~`, `.` or a drive letter
         - Default: return as string
 
+        Candidates are matched with cheap string predicates before the validator
+        is called, so most non-matching values do not raise and catch exceptions.
+
         Parameters
         ----------
         key : str
@@ -161,20 +242,28 @@ class EnvironmentSetup:
         if key == "THEME_MODE":
             return v.parse_theme_mode(value)
 
-        # Try boolean
-        try:
-            return v.ensure_boolean(value, False, key)
-        except ValueError:
-            pass
-
-        # Try positive integer
-        try:
-            return v.ensure_positive_int(value, 0, key)
-        except ValueError:
-            pass
+        # Boolean (lowercased once, resolved directly without a validator round-trip)
+        as_bool = BOOL_BY_VALUE.get(value.lower())
+        if as_bool is not None:
+            return as_bool
+
+        # Positive integer: candidates use `int()` syntax (surrounding whitespace,
+        # a leading "+", "_" digit separators); the validator rejects the rest
+        digits = value.strip()
+        if digits[:1] == "+":
+            digits = digits[1:]
+        if digits.replace("_", "").isdecimal():
+            try:
+                return v.ensure_positive_int(value, 0, key)
+            except ValueError:
+                pass
 
         # Path auto-handling
-        if any(x in key for x in ("PATH", "DIR", "FILE")):
+        if self._PATH_KEY_RE.search(key):
+            # Only values that look like paths (absolute, home- or dot-relative,
+            # drive-letter) are resolved; anything else is kept as a string.
+            if not value or (value[0] not in "/\\~." and value[1:2] != ":"):
+                return v.ensure_string(value, "", key)
             p = Path(value).expanduser().resolve()
             if p.suffix:
                 return v.validate_file_path(str(p))
@@ -189,7 +278,7 @@ class EnvironmentSetup:
 
         The result includes:
         - Flattened TOML values (e.g. `[app].name` → `APP_NAME`)
-        - .env overrides (dev mode only)
+        - .env overrides (dev mode only, restricted to keys declared in `.env`)
         - Auto-casted types for `.env` values
         - A meta-flag `IS_DEV_MODE`
 
@@ -204,19 +293,19 @@ class EnvironmentSetup:
             Logger.error(f"Failed to load TOML configuration from {self.toml_path}")
             return config
 
-        # Flatten TOML sections
-        for section, values in self.toml_data.items():
-            for key, value in values.items():
-                config[f"{section.upper()}_{key.upper()}"] = value
+        # Flatten TOML sections (cached per file version)
+        config.update(_flatten_toml(str(self.toml_path), self._toml_mtime))
 
-        # Merge `.env` overrides
+        # Merge `.env` overrides (only keys declared in `.env`, not the whole environment)
         if self.env_loaded:
-            for key, value in os.environ.items():
-                if key.isupper():
-                    try:
-                        config[key] = self._auto_cast(key, value)
-                    except Exception:
-                        config[key] = value  # Fallback
+            for key in self.env_keys:
+                value = os.environ.get(key)
+                if value is None or not key.isupper():
+                    continue
+                try:
+                    config[key] = self._auto_cast(key, value)
+                except Exception:
+                    config[key] = value  # Fallback
 
         # Add meta flag
         config["IS_DEV_MODE"] = self.is_dev
@@ -9,4 +9,8 @@ class AppTheme(Enum):
     """
     LIGHT = "LIGHT"
     DARK = "DARK"
-    AUTO = "AUTO"
\ No newline at end of file
+    AUTO = "AUTO"
+
+
+# Value → member lookup table (avoids `Enum.__call__` on hot paths)
+APP_THEME_BY_VALUE = {member.value: member for member in AppTheme}
@@ -14,4 +14,8 @@ class LogLevel(Enum):
     INFO = "INFO"
     WARNING = "WARNING"
     ERROR = "ERROR"
-    CRITICAL = "CRITICAL"
\ No newline at end of file
+    CRITICAL = "CRITICAL"
+
+
+# Value → member lookup table (avoids `Enum.__call__` on hot paths)
+LOG_LEVEL_BY_VALUE = {member.value: member for member in LogLevel}
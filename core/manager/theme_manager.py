@@ -1,11 +1,61 @@
+import time
+from functools import lru_cache
+
 from PySide6.QtGui import QPalette, QColor
-from PySide6.QtCore import Qt, Signal, QObject, QTimer
+from PySide6.QtCore import Qt, Signal, QObject, QTimer, QRunnable, QThreadPool
 from PySide6.QtWidgets import QApplication, QWidget
 
-from core.enums.app_themes import AppTheme
+from core.enums.app_themes import AppTheme, APP_THEME_BY_VALUE
 from core.util.system_info import *
 
 
+@lru_cache(maxsize=64)
+def _load_qss(path: str, mtime_ns: int) -> str:
+    """Read a stylesheet; memoized per (path, mtime), so an edited file is re-read."""
+    # Read as bytes and decode in one go (no incremental text-mode decoding)
+    with open(path, "rb") as f:
+        return f.read().decode("utf-8")
+
+
+# Palette colors per role, allocated once and shared by the palette builders
+_ACCENT = QColor(42, 130, 218)
+_WHITE = QColor(Qt.white)
+_BLACK = QColor(Qt.black)
+_RED = QColor(Qt.red)
+
+_LIGHT_COLORS: dict[QPalette.ColorRole, QColor] = {
+    QPalette.Window: QColor(255, 255, 255),
+    QPalette.WindowText: _BLACK,
+    QPalette.Base: QColor(245, 245, 245),
+    QPalette.AlternateBase: QColor(240, 240, 240),
+    QPalette.ToolTipBase: _BLACK,
+    QPalette.ToolTipText: _WHITE,
+    QPalette.Text: _BLACK,
+    QPalette.Button: QColor(240, 240, 240),
+    QPalette.ButtonText: _BLACK,
+    QPalette.BrightText: _RED,
+    QPalette.Link: _ACCENT,
+    QPalette.Highlight: _ACCENT,
+    QPalette.HighlightedText: _WHITE,
+}
+
+_DARK_COLORS: dict[QPalette.ColorRole, QColor] = {
+    QPalette.Window: QColor(53, 53, 53),
+    QPalette.WindowText: _WHITE,
+    QPalette.Base: QColor(35, 35, 35),
+    QPalette.AlternateBase: QColor(53, 53, 53),
+    QPalette.ToolTipBase: _WHITE,
+    QPalette.ToolTipText: _WHITE,
+    QPalette.Text: _WHITE,
+    QPalette.Button: QColor(53, 53, 53),
+    QPalette.ButtonText: _WHITE,
+    QPalette.BrightText: _RED,
+    QPalette.Link: _ACCENT,
+    QPalette.Highlight: _ACCENT,
+    QPalette.HighlightedText: _BLACK,
+}
+
+
 class ThemeManager(QObject):
     """
     Manages application themes (light, dark, auto) and applies them to the QApplication.
@@ -16,10 +66,15 @@ class ThemeManager(QObject):
     - AUTO theme detects system theme changes and updates accordingly.
     """
     theme_changed = Signal(AppTheme)
+    _system_theme_probed = Signal(bool)  # Emitted from the worker thread by _SystemThemeProbe
     _instance = None
     _current_theme: AppTheme = AppTheme.AUTO
     _config: dict = {}
     _last_system_theme: AppTheme = None  # Track last detected system theme
+    _applied_theme: AppTheme = None  # Effective theme (LIGHT/DARK) last applied to the app
+    _APPLY_THROTTLE_MS = 50  # Minimum interval between two theme applications
+    _light_palette: QPalette = None  # Built on first use, then reused
+    _dark_palette: QPalette = None
 
     def __new__(cls, *args, **kwargs):
         if not cls._instance:
@@ -30,21 +85,85 @@ class ThemeManager(QObject):
         if getattr(self, "_initialized", False):
             return
         super().__init__()
+
+        # Throttle for theme application (see `_throttled_apply`)
+        self._apply_pending = False
+        self._apply_timer = QTimer(self)
+        self._apply_timer.setSingleShot(True)
+        self._apply_timer.setInterval(ThemeManager._APPLY_THROTTLE_MS)
+        self._apply_timer.timeout.connect(self._flush_pending_apply)
+
         self._initialized = True
         ThemeManager._config = config or {}
-        mode = ThemeManager._config.get("WINDOW_THEME_MODE", "AUTO").upper()
-        try:
-            ThemeManager._current_theme = AppTheme(mode) if not isinstance(mode, AppTheme) else mode
-        except ValueError:
+        mode = ThemeManager._config.get("WINDOW_THEME_MODE", "AUTO")
+        theme = mode if isinstance(mode, AppTheme) else APP_THEME_BY_VALUE.get(str(mode).upper())
+        if theme is None:
             Logger.error(f"Unmappable 'WINDOW_THEME_MODE' == '{mode}' in config.")
             Logger.debug("Falling back to LIGHT theme mode.")
-            ThemeManager._current_theme = AppTheme.LIGHT
+            theme = AppTheme.LIGHT
+        ThemeManager._current_theme = theme
 
         # Detect initial system theme
         ThemeManager._last_system_theme = AppTheme.DARK if is_system_dark_mode() else AppTheme.LIGHT
 
         ThemeManager._apply_current_theme()
 
+        # Follow OS theme changes through notifications instead of polling
+        self._connect_system_theme_notifications()
+
+    # -----------------------
+    # System Theme Notifications
+    # -----------------------
+    def _connect_system_theme_notifications(self):
+        """
+        Subscribe to the OS color-scheme change notification exposed by Qt.
+
+        Qt (6.5+) forwards the native notifications (WM_SETTINGCHANGE on Windows,
+        AppleInterfaceThemeChangedNotification on macOS, the XDG settings portal
+        on Linux) as ``QStyleHints.colorSchemeChanged``, so nothing runs while
+        the system theme is stable.
+        """
+        app = QApplication.instance()
+        hints = app.styleHints() if app else None
+        if hints is None or not hasattr(hints, "colorSchemeChanged"):
+            Logger.debug("System theme notifications unavailable (requires Qt 6.5+).")
+            return
+        self._system_theme_probed.connect(self._on_system_theme_probed)
+        hints.colorSchemeChanged.connect(self._check_system_theme_change)
+
+    def _check_system_theme_change(self, *_):
+        """
+        Re-detect the system theme after a notification.
+
+        When Qt reports a definite color scheme it is used directly. Otherwise the
+        native detection (which may spawn subprocesses) runs on the global thread
+        pool, and the result is delivered back to the GUI thread through
+        ``_system_theme_probed``.
+        """
+        is_dark = _qt_color_scheme_is_dark()
+        if is_dark is not None:
+            clear_system_theme_cache()
+            self._on_system_theme_probed(is_dark)
+            return
+        if _detect_native_dark_mode is _detect_fallback_theme:
+            # The fallback reads the application palette: Qt objects stay on the GUI thread
+            clear_system_theme_cache()
+            self._on_system_theme_probed(_detect_fallback_theme())
+            return
+        QThreadPool.globalInstance().start(_SystemThemeProbe(self._system_theme_probed))
+
+    def _on_system_theme_probed(self, is_dark: bool):
+        """Store a probe result and re-apply the theme in AUTO mode (GUI thread)."""
+        system_theme = AppTheme.DARK if is_dark else AppTheme.LIGHT
+        if system_theme == ThemeManager._last_system_theme:
+            return
+
+        ThemeManager._last_system_theme = system_theme
+        Logger.debug(f"System theme changed to {system_theme.name}.")
+        if ThemeManager._current_theme == AppTheme.AUTO:
+            ThemeManager._throttled_apply()
+            self.theme_changed.emit(AppTheme.AUTO)
+
     # -----------------------
     # Theme Control
     # -----------------------
@@ -67,21 +186,56 @@ class ThemeManager(QObject):
     def set_canonical_theme(theme: AppTheme):
         """
         Sets the canonical theme (LIGHT, DARK, AUTO).
+
+        Re-setting AUTO while already in AUTO only re-applies the theme when the
+        (TTL-cached) system theme has changed since the last detection.
         :param theme: The desired AppTheme to set.
         """
         if theme != ThemeManager._current_theme or theme == AppTheme.AUTO:
-            ThemeManager._current_theme = theme
-            ThemeManager._config["WINDOW_THEME_MODE"] = theme.name
-
             # Update system theme reference when switching to AUTO
             if theme == AppTheme.AUTO:
-                ThemeManager._last_system_theme = AppTheme.DARK if is_system_dark_mode() else AppTheme.LIGHT
+                system_theme = AppTheme.DARK if is_system_dark_mode() else AppTheme.LIGHT
+                if (ThemeManager._current_theme == AppTheme.AUTO
+                        and system_theme == ThemeManager._last_system_theme):
+                    return
+                ThemeManager._last_system_theme = system_theme
 
-            ThemeManager._apply_current_theme()
+            ThemeManager._current_theme = theme
+            ThemeManager._config["WINDOW_THEME_MODE"] = theme.name
+
+            ThemeManager._throttled_apply()
             # Emit signal through singleton instance
             if ThemeManager._instance:
                 ThemeManager._instance.theme_changed.emit(theme)
 
+    @staticmethod
+    def _throttled_apply():
+        """
+        Apply the current theme, coalescing bursts of requests.
+
+        The first request applies immediately; further requests within
+        ``_APPLY_THROTTLE_MS`` are merged into a single trailing application of
+        the latest theme. Falls back to a direct apply before initialization.
+        """
+        instance = ThemeManager._instance
+        if instance is None or not getattr(instance, "_initialized", False):
+            ThemeManager._apply_current_theme()
+            return
+
+        if instance._apply_timer.isActive():
+            instance._apply_pending = True
+            return
+
+        ThemeManager._apply_current_theme()
+        instance._apply_timer.start()
+
+    def _flush_pending_apply(self):
+        """Trailing edge of `_throttled_apply`: apply the latest requested theme."""
+        if self._apply_pending:
+            self._apply_pending = False
+            ThemeManager._apply_current_theme()
+            self._apply_timer.start()
+
     @staticmethod
     def _apply_current_theme():
         """Applies the current theme to the QApplication."""
@@ -91,6 +245,11 @@ class ThemeManager(QObject):
         if theme == AppTheme.AUTO:
             theme = ThemeManager._last_system_theme
 
+        # Nothing to do if the effective theme is already applied (e.g. AUTO
+        # re-detected the same system theme, or LIGHT -> AUTO on a light OS)
+        if theme == ThemeManager._applied_theme:
+            return
+
         app = QApplication.instance()
         if not app:
             Logger.error("QApplication instance not found. Cannot apply theme.")
@@ -103,7 +262,8 @@ class ThemeManager(QObject):
             ThemeManager._apply_light_palette()
             Logger.debug("Applied LIGHT theme.")
 
-        # Force UI refresh
+        # Force a full UI refresh now that the effective theme actually changed
+        ThemeManager._applied_theme = theme
         app.setStyle(app.style().objectName())
 
     @staticmethod
@@ -111,18 +271,21 @@ class ThemeManager(QObject):
         """
         Apply a QSS file to a widget.
 
+        The file content is cached per (path, mtime), so applying the same file to
+        many widgets costs a single `stat` each and reads it from disk only once.
+
         :param widget: The QWidget to style
         :param path: Full path to the .qss file
         """
-        if not os.path.exists(path):
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
             Logger.error(f"QSS file not found: {path}")
             return
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                qss = f.read()
-                widget.setStyleSheet(qss)
-                Logger.debug(f"Applied stylesheet from {path} to widget {widget.objectName()}")
+            widget.setStyleSheet(_load_qss(path, mtime_ns))
+            Logger.debug(f"Applied stylesheet from {path} to widget {widget.objectName()}")
         except Exception as e:
             Logger.error(f"Failed to apply stylesheet: {e}")
 
@@ -136,22 +299,9 @@ class ThemeManager(QObject):
             Logger.error("QApplication instance not found. Cannot apply theme.")
             return
 
-        light_palette = QPalette()
-        light_palette.setColor(QPalette.Window, QColor(255, 255, 255))
-        light_palette.setColor(QPalette.WindowText, Qt.black)
-        light_palette.setColor(QPalette.Base, QColor(245, 245, 245))
-        light_palette.setColor(QPalette.AlternateBase, QColor(240, 240, 240))
-        light_palette.setColor(QPalette.ToolTipBase, Qt.black)
-        light_palette.setColor(QPalette.ToolTipText, Qt.white)
-        light_palette.setColor(QPalette.Text, Qt.black)
-        light_palette.setColor(QPalette.Button, QColor(240, 240, 240))
-        light_palette.setColor(QPalette.ButtonText, Qt.black)
-        light_palette.setColor(QPalette.BrightText, Qt.red)
-        light_palette.setColor(QPalette.Link, QColor(42, 130, 218))
-        light_palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-        light_palette.setColor(QPalette.HighlightedText, Qt.white)
-
-        app.setPalette(light_palette)
+        if ThemeManager._light_palette is None:
+            ThemeManager._light_palette = ThemeManager._build_light_palette()
+        app.setPalette(ThemeManager._light_palette)
 
     @staticmethod
     def _apply_dark_palette():
@@ -160,22 +310,23 @@ class ThemeManager(QObject):
             Logger.error("QApplication instance not found. Cannot apply theme.")
             return
 
+        if ThemeManager._dark_palette is None:
+            ThemeManager._dark_palette = ThemeManager._build_dark_palette()
+        app.setPalette(ThemeManager._dark_palette)
+
+    @staticmethod
+    def _build_light_palette() -> QPalette:
+        light_palette = QPalette()
+        for role, color in _LIGHT_COLORS.items():
+            light_palette.setColor(role, color)
+        return light_palette
+
+    @staticmethod
+    def _build_dark_palette() -> QPalette:
         dark_palette = QPalette()
-        dark_palette.setColor(QPalette.Window, QColor(53, 53, 53))
-        dark_palette.setColor(QPalette.WindowText, Qt.white)
-        dark_palette.setColor(QPalette.Base, QColor(35, 35, 35))
-        dark_palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
-        dark_palette.setColor(QPalette.ToolTipBase, Qt.white)
-        dark_palette.setColor(QPalette.ToolTipText, Qt.white)
-        dark_palette.setColor(QPalette.Text, Qt.white)
-        dark_palette.setColor(QPalette.Button, QColor(53, 53, 53))
-        dark_palette.setColor(QPalette.ButtonText, Qt.white)
-        dark_palette.setColor(QPalette.BrightText, Qt.red)
-        dark_palette.setColor(QPalette.Link, QColor(42, 130, 218))
-        dark_palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-        dark_palette.setColor(QPalette.HighlightedText, Qt.black)
-
-        app.setPalette(dark_palette)
+        for role, color in _DARK_COLORS.items():
+            dark_palette.setColor(role, color)
+        return dark_palette
 
     @staticmethod
     def get_current_theme() -> AppTheme:
@@ -197,17 +348,81 @@ class ThemeManager(QObject):
     def current_theme(self):
         return self._current_theme
 
+
+class _SystemThemeProbe(QRunnable):
+    """Runs system theme detection off the GUI thread and reports it through a signal."""
+
+    def __init__(self, result_signal):
+        super().__init__()
+        self._result_signal = result_signal
+
+    def run(self):
+        # Only started for the native (thread-safe) detectors; the Qt palette
+        # fallback runs on the GUI thread (see _check_system_theme_change)
+        clear_system_theme_cache()
+        self._result_signal.emit(_detect_native_dark_mode())
+
+
 # -----------------------
 # System Theme Detection
 # -----------------------
+_SYSTEM_THEME_TTL = 2.0  # seconds
+_system_theme_cache: tuple[float, bool] | None = None  # (timestamp, is_dark)
+
+
 def is_system_dark_mode() -> bool:
-    if IS_MACOS:
-        return detect_macos_theme()
-    if IS_WINDOWS:
-        return detect_windows_theme()
-    if IS_LINUX:
-        return detect_linux_theme()
-    return _detect_fallback_theme()
+    """
+    Detect whether the OS uses a dark theme.
+
+    The result is cached for ``_SYSTEM_THEME_TTL`` seconds, since detection may spawn
+    a subprocess or read the registry. Use :func:`clear_system_theme_cache` to force
+    a fresh query.
+    """
+    global _system_theme_cache
+    now = time.monotonic()
+    cached = _system_theme_cache
+    if cached is not None and now - cached[0] < _SYSTEM_THEME_TTL:
+        return cached[1]
+
+    is_dark = _detect_system_dark_mode()
+    _system_theme_cache = (now, is_dark)
+    return is_dark
+
+
+def clear_system_theme_cache():
+    """Drop the cached system theme so the next query hits the OS again."""
+    global _system_theme_cache
+    _system_theme_cache = None
+    clear_linux_theme_cache()
+
+
+def _qt_color_scheme_is_dark() -> bool | None:
+    """
+    Return the color scheme reported by Qt (6.5+), or None if it is unknown.
+
+    Qt reads it from the platform (registry on Windows, NSApp appearance on macOS,
+    the XDG portal on Linux) and keeps it current, so this costs no system call.
+    Must be called from the GUI thread.
+    """
+    color_scheme = getattr(Qt, "ColorScheme", None)
+    app = QApplication.instance()
+    if color_scheme is None or app is None:
+        return None
+    scheme = app.styleHints().colorScheme()
+    if scheme == color_scheme.Dark:
+        return True
+    if scheme == color_scheme.Light:
+        return False
+    return None
+
+
+def _detect_system_dark_mode() -> bool:
+    """Query the current theme (uncached), preferring what Qt already knows."""
+    is_dark = _qt_color_scheme_is_dark()
+    if is_dark is not None:
+        return is_dark
+    return _detect_native_dark_mode()
+
 
 def _detect_fallback_theme() -> bool:
     """Fallback theme detection using Qt heuristic."""
@@ -217,4 +432,16 @@ def _detect_fallback_theme() -> bool:
         window_color = palette.color(QPalette.Window)
         text_color = palette.color(QPalette.WindowText)
         return window_color.value() < text_color.value()
-    return False
\ No newline at end of file
+    return False
+
+
+# Platform detector used by _detect_system_dark_mode() and _SystemThemeProbe.
+# The OS never changes at runtime, so the choice is made once at import.
+if IS_MACOS:
+    _detect_native_dark_mode = detect_macos_theme
+elif IS_WINDOWS:
+    _detect_native_dark_mode = detect_windows_theme
+elif IS_LINUX:
+    _detect_native_dark_mode = detect_linux_theme
+else:
+    _detect_native_dark_mode = _detect_fallback_theme
@@ -1,10 +1,13 @@
+import atexit
 import os
 import sys
 import platform
-from datetime import datetime
+import queue
+import threading
+import time
 from pathlib import Path
 
-from core.enums.log_level import LogLevel
+from core.enums.log_level import LogLevel, LOG_LEVEL_BY_VALUE
 
 
 class Logger:
@@ -23,6 +26,12 @@ class Logger:
     LOG_FILE_PATH: Path = Path(log_file_name)
     CONSOLE_FORCE_COLORED: bool = False
 
+    _file_handle = None  # Log file kept open while persistence logging is enabled
+    _file_lock = threading.Lock()
+    _queue: queue.SimpleQueue = queue.SimpleQueue()  # (line, flush) pairs for the writer thread
+    _writer: threading.Thread = None  # Writes queued lines to the log file
+    _atexit_registered: bool = False
+
     _COLORS = {
         LogLevel.DEBUG: "\033[38;5;213m",    # soft magenta
         LogLevel.INFO: "\033[38;5;39m",      # blue
@@ -32,6 +41,12 @@ class Logger:
     }
     RESET = "\033[0m"
 
+    # Pre-formatted "[LEVEL] " prefixes
+    _PREFIX = {level: f"[{level.name}] " for level in LogLevel}
+
+    # Caller tag per code object; None marks call sites tagged by their self/cls
+    _TAG_CACHE: dict = {}
+
     _PRIORITY = {
         LogLevel.DEBUG: 10,
         LogLevel.INFO: 20,
@@ -40,6 +55,9 @@ class Logger:
         LogLevel.CRITICAL: 50,
     }
 
+    # Levels whose file output is flushed immediately (WARNING and above)
+    _FLUSH_LEVELS = frozenset((LogLevel.WARNING, LogLevel.ERROR, LogLevel.CRITICAL))
+
     @classmethod
     def _get_app_root(cls) -> Path:
         """Get the application root directory consistently."""
@@ -69,16 +87,21 @@ class Logger:
             cls.PERSISTENCE_LOGGING = True
         else:
             log_level_name = os.getenv("CONSOLE_OUTPUT_LEVEL", "INFO").upper()
-            cls.LEVEL = LogLevel.__members__.get(log_level_name, LogLevel.INFO)
+            cls.LEVEL = LOG_LEVEL_BY_VALUE.get(log_level_name, LogLevel.INFO)
             cls.PERSISTENCE_LOGGING = False
 
         # Determine log file path
         cls.LOG_FILE_PATH = (project_root / cls.log_file_name).resolve()
 
+        # Finish the previous session first: its writer thread still holds queued
+        # lines, which must not land after a new header (or outlive the setting)
+        cls._close_log_file()
+
         # Auto-create log directory
         if cls.PERSISTENCE_LOGGING:
             cls.LOG_FILE_PATH.parent.mkdir(parents=True, exist_ok=True)
             cls._write_file_header()
+            cls._open_log_file()
 
         # Disable colors if not a TTY and FORCE_COLOR not set
         if not sys.stdout.isatty() and not cls.CONSOLE_FORCE_COLORED:
@@ -94,7 +117,7 @@ class Logger:
     def _write_file_header(cls):
         """Writes an informative header at the top of the log file."""
         app_name = os.getenv("PERSISTENCE_LOGGING_TARGET_NAME", "<Unnamed Application>")
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        now = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
 
         header_lines = [
             "=" * 70,
@@ -120,13 +143,84 @@ class Logger:
             if cls.CONSOLE_OUTPUT_ENABLED:
                 Logger.warning(f"[LoggerError] Failed to write log file header: {e}")
 
+    # ---------------------------
+    # Log File Handle
+    # ---------------------------
+    @classmethod
+    def _open_log_file(cls):
+        """Open (or reopen) the log file in append mode and keep it open for writes."""
+        cls._close_log_file()
+        try:
+            cls._file_handle = open(cls.LOG_FILE_PATH, "a", encoding="utf-8", buffering=8192)
+        except Exception as e:
+            if cls.CONSOLE_OUTPUT_ENABLED:
+                # `print` is used here because logging failed
+                print(f"!!! - LoggerError: Failed to open log file: {e}")
+            return
+
+        cls._writer = threading.Thread(target=cls._drain, name="LoggerWriter", daemon=True)
+        cls._writer.start()
+
+        if not cls._atexit_registered:
+            atexit.register(cls._close_log_file)
+            cls._atexit_registered = True
+
+    @classmethod
+    def _drain(cls):
+        """Writer thread: write queued lines to the log file until a `None` sentinel."""
+        while True:
+            item = cls._queue.get()
+            if item is None:
+                return
+            line, flush = item
+            try:
+                with cls._file_lock:
+                    handle = cls._file_handle
+                    if handle is not None:
+                        handle.write(line)
+                        if flush:
+                            handle.flush()
+            except Exception as e:
+                if cls.CONSOLE_OUTPUT_ENABLED:
+                    # `print` is used here because logging failed
+                    print(f"!!! - LoggerError: Failed to write to log file: {e}")
+
+    @classmethod
+    def _close_log_file(cls):
+        """Write out pending messages, stop the writer thread and close the log file."""
+        writer, cls._writer = cls._writer, None
+        if writer is not None:
+            cls._queue.put(None)
+            writer.join(timeout=5)
+
+        with cls._file_lock:
+            handle, cls._file_handle = cls._file_handle, None
+            if handle is not None:
+                try:
+                    handle.close()
+                except Exception:
+                    pass
+
     # ---------------------------
     # Core Logging
     # ---------------------------
     @classmethod
     def _enabled_for(cls, level: LogLevel) -> bool:
         """Return True if the log level is >= current filter."""
-        return cls._PRIORITY.get(level, 0) >= cls._PRIORITY.get(cls.LEVEL, 0)
+        # Every LogLevel member has a priority, so plain indexing is safe
+        return cls._PRIORITY[level] >= cls._PRIORITY[cls.LEVEL]
+
+    @classmethod
+    def is_enabled_for(cls, level: LogLevel) -> bool:
+        """
+        Check whether messages of the given level would be emitted.
+
+        Use it to skip building expensive log messages that would be filtered out.
+
+        Args:
+            level (LogLevel): The level to check.
+        """
+        return cls._enabled_for(level)
 
     @classmethod
     def log(cls, message: str, level: LogLevel = LogLevel.INFO):
@@ -134,24 +228,19 @@ class Logger:
         if not cls._enabled_for(level):
             return
 
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        plain_text = f"[{timestamp}] [{level.name}] {message}"
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+        plain_text = "".join(("[", timestamp, "] ", cls._PREFIX[level], message))
 
         # Console output (colored)
         if cls.CONSOLE_OUTPUT_ENABLED:
-            color = cls._COLORS.get(level, "")
+            color = cls._COLORS[level]
             reset = cls.RESET if color else ""
-            print(f"{color}{plain_text}{reset}")
+            sys.stdout.write("".join((color, plain_text, reset, "\n")))
 
-        # File output (no colors)
-        if cls.PERSISTENCE_LOGGING:
-            try:
-                with open(cls.LOG_FILE_PATH, "a", encoding="utf-8") as f:
-                    f.write(plain_text + "\n")
-            except Exception as e:
-                if cls.CONSOLE_OUTPUT_ENABLED:
-                    # `print` is used here because logging failed
-                    print(f"!!! - LoggerError: Failed to write to log file: {e}")
+        # File output (no colors) is handed to the writer thread, so the caller
+        # never blocks on disk I/O; WARNING and above are flushed right away
+        if cls.PERSISTENCE_LOGGING and cls._writer is not None:
+            cls._queue.put((plain_text + "\n", level in cls._FLUSH_LEVELS))
 
     # ---------------------------
     # Convenience Shortcuts
@@ -159,33 +248,60 @@ class Logger:
 
     @classmethod
     def _format_message(cls, msg: str, tag=None) -> str:
-        import inspect
-
         if tag is None:
-            # Get caller info two frames up
-            frame = inspect.currentframe().f_back.f_back
-            caller_self = frame.f_locals.get('self')
-            caller_cls = frame.f_locals.get('cls')
-            func_name = frame.f_code.co_name  # function name
-
-            if caller_self and hasattr(caller_self, '__class__'):
-                tag = caller_self.__class__.__name__
-            elif caller_cls and hasattr(caller_cls, '__name__'):
-                tag = caller_cls.__name__
-            elif func_name and func_name != "<module>":
-                tag = func_name
-            else:
-                module = inspect.getmodule(frame)
-                tag = getattr(module, '__name__', '?').split('.')[-1]
-
-            # Clean up weird or useless tags
-            if tag in ("str", "builtins", "__main__"):
-                tag = "?"
+            # Get caller info two frames up (_format_message -> shortcut -> caller)
+            frame = sys._getframe(2)
+            code = frame.f_code
+            try:
+                tag = cls._TAG_CACHE[code]
+            except KeyError:
+                tag = cls._TAG_CACHE[code] = cls._static_tag(frame)
+            if tag is None:
+                tag = cls._dynamic_tag(frame)
         elif not isinstance(tag, str):
             tag = str(tag)
 
         return f"[{tag}] {msg}"
 
+    @staticmethod
+    def _static_tag(frame):
+        """
+        Tag for a call site that does not depend on the caller's locals, or None.
+
+        Code that can see a `self` or `cls` is tagged with its (runtime) class, so
+        only the function/module fallback can be computed once per code object.
+        """
+        code = frame.f_code
+        names = code.co_varnames + code.co_cellvars + code.co_freevars
+        if "self" in names or "cls" in names:
+            return None
+
+        func_name = code.co_name
+        if func_name and func_name != "<module>":
+            tag = func_name
+        else:
+            tag = frame.f_globals.get('__name__', '?').split('.')[-1]
+        return "?" if tag in ("str", "builtins", "__main__") else tag
+
+    @staticmethod
+    def _dynamic_tag(frame) -> str:
+        """Tag for a call site that has a `self` or `cls` (resolved on every call)."""
+        caller_self = frame.f_locals.get('self')
+        caller_cls = frame.f_locals.get('cls')
+        func_name = frame.f_code.co_name  # function name
+
+        if caller_self and hasattr(caller_self, '__class__'):
+            tag = caller_self.__class__.__name__
+        elif caller_cls and hasattr(caller_cls, '__name__'):
+            tag = caller_cls.__name__
+        elif func_name and func_name != "<module>":
+            tag = func_name
+        else:
+            tag = frame.f_globals.get('__name__', '?').split('.')[-1]
+
+        # Clean up weird or useless tags
+        return "?" if tag in ("str", "builtins", "__main__") else tag
+
     @classmethod
     def debug(cls, msg: str, tag=None):
         """
@@ -197,6 +313,8 @@ class Logger:
                 If not provided, the tag defaults to the caller's class name
                 or module name.
         """
+        if not cls._enabled_for(LogLevel.DEBUG):
+            return
         cls.log(cls._format_message(msg, tag), LogLevel.DEBUG)
 
     @classmethod
@@ -210,6 +328,8 @@ class Logger:
                 If not provided, the tag defaults to the caller's class name
                 or module name.
         """
+        if not cls._enabled_for(LogLevel.INFO):
+            return
         cls.log(cls._format_message(msg, tag), LogLevel.INFO)
 
     @classmethod
@@ -223,6 +343,8 @@ class Logger:
                 If not provided, the tag defaults to the caller's class name
                 or module name.
         """
+        if not cls._enabled_for(LogLevel.WARNING):
+            return
         cls.log(cls._format_message(msg, tag), LogLevel.WARNING)
 
     @classmethod
@@ -236,6 +358,8 @@ class Logger:
                 If not provided, the tag defaults to the caller's class name
                 or module name.
         """
+        if not cls._enabled_for(LogLevel.ERROR):
+            return
         cls.log(cls._format_message(msg, tag), LogLevel.ERROR)
 
     @classmethod
@@ -249,5 +373,7 @@ class Logger:
                 If not provided, the tag defaults to the caller's class name
                 or module name.
         """
+        if not cls._enabled_for(LogLevel.CRITICAL):
+            return
         cls.log(cls._format_message(msg, tag), LogLevel.CRITICAL)
 
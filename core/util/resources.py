@@ -1,6 +1,9 @@
+import json
 import os
 import sys
-from types import MethodType
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from typing import Optional
 from pathlib import Path
 
@@ -20,10 +23,14 @@ class Resources:
     Features:
     -----------
     - Resolves base paths depending on environment (dev vs bundled).
-    - Indexes all files in resource directories for fast access.
-    - Provides dynamic getter methods:
-        - get_in<resource>(filename_or_path): returns the absolute path to a resource.
-        - get_all_in<resource>(): returns all files for a given resource type.
+    - Indexes the files of each resource directory on first use (optionally
+      invalidated by `watch()` when a directory changes).
+    - Provides lookups by resource type:
+        - get(kind, filename_or_path): returns the absolute path to a resource.
+        - get_all(kind): returns all files for a given resource type.
+    - Provides per-type shortcuts bound to those lookups:
+        - get_in_<resource>(filename_or_path)
+        - get_all_in_<resource>()
     - Automatically creates required directories in development mode.
     - Logs errors and warnings when resources are missing or misconfigured.
 
@@ -31,126 +38,299 @@ class Resources:
     -----------
     _cfg : dict
         Stores the normalized resource configuration loaded from application config.
+    _base_paths : dict
+        Absolute directory of each resource type.
     _resources : dict
-        Indexed list of all files for each resource type.
+        Indexed list of all files for each resource type (filled lazily).
+    _lookup : dict
+        Per resource type, maps the absolute and relative path of each indexed
+        file to its absolute path (filled lazily).
     _is_bundled : bool
         True if the application is running as a frozen/bundled executable.
 
     Methods:
     --------
     _get_base_path() -> Path
-        Returns the base path for resources depending on environment.
+        Returns the (cached) base path for resources depending on environment.
     _list_files(directory: str) -> list[str]
         Recursively lists all files in the given directory.
-    _create_get_all_method(name: str)
-        Dynamically creates get_all_<name>() method for accessing all files.
-    _create_get_method(name: str)
-        Dynamically creates get_<name>(filename_or_path) method for accessing a single file.
+    _create_accessors(name: str)
+        Binds the get_in_<name>() / get_all_in_<name>() shortcuts for a resource type.
     initialize(cfg: Optional[dict] = None)
-        Initializes the resource manager with configuration, indexes all files,
-        creates getter methods, and prepares directories if needed.
-    get_all() -> dict[str, list[str]]
-        Returns the dictionary of all indexed resources.
+        Initializes the resource manager with configuration, creates the
+        shortcuts, and prepares directories if needed.
+    invalidate_resources()
+        Clears the file indexes and the memoized lookups.
+    get(kind: str, path: str) -> str
+        Returns the absolute path of a single resource (memoized).
+    get_all(kind: Optional[str] = None) -> list[str] | dict[str, list[str]]
+        Returns the files of one resource type, or the dictionary of all of them.
     """
 
     _cfg = {}
+    _CFG_PREFIX = "RESOURCES_"  # Config keys of the [resources] table
+    _base_paths = {}
     _resources = {}
+    _lookup = {}
+    _index_locks = {}  # One lock per resource type, so each directory is walked once
+    _ensured_dirs: set[str] = set()  # Directories already created by initialize()
+    _watcher = None
     _is_bundled = getattr(sys, 'frozen', False)
+    _base_path: Path = None  # See _get_base_path()
+    _MANIFEST_NAME = "resource_manifest.json"  # Written by main.spec into bundled resources
+    _manifest: dict = None
 
     @classmethod
     def _get_base_path(cls):
-        """Get the base path for resources (works in both dev and bundled env)."""
-        if cls._is_bundled:
-            # In bundled app, resources are in _internal folder
-            return Path(sys._MEIPASS) / "resources"
-        else:
-            # In development, use project root
-            return Path.cwd() / "resources"
+        """
+        Get the base path for resources (works in both dev and bundled env).
+
+        Computed on first use, then reused.
+        """
+        if cls._base_path is None:
+            if cls._is_bundled:
+                # In bundled app, resources are in _internal folder
+                cls._base_path = Path(sys._MEIPASS) / "resources"
+            else:
+                # In development, use project root
+                cls._base_path = Path.cwd() / "resources"
+        return cls._base_path
 
     @classmethod
     def _list_files(cls, directory: str) -> list[str]:
-        """Recursively list all files in a directory."""
+        """
+        Recursively list all files in a directory.
+
+        Uses an explicit stack with `os.scandir`, whose entries already know their
+        type, so no extra `stat` call is needed per file. Missing or unreadable
+        directories are skipped, like `os.walk` does.
+        """
         files = []
-        if not os.path.exists(directory):
-            return files
-        for root, _, filenames in os.walk(directory):
-            for f in filenames:
-                files.append(os.path.join(root, f))
+        pending = [directory]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        # Same semantics as os.walk: symlinked dirs are not descended
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                pending.append(entry.path)
+                        else:
+                            files.append(entry.path)
+            except (FileNotFoundError, NotADirectoryError, PermissionError):
+                continue
         return files
 
     @classmethod
-    def _create_get_all_method(cls, name: str):
-        """Create get_all_in<name>()"""
-
-        def method(self_or_cls):
-            return cls._resources.get(name, [])
-
-        method.__name__ = f"get_all_in_{name}"
-        setattr(cls, method.__name__, MethodType(method, cls))
-
-    @classmethod
-    def _create_get_method(cls, name: str):
-        """Create get_in<name>(filename_or_path)"""
-
-        def method(self_or_cls, path: str):
-            base_path = getattr(cls, name)
-
-            # Try direct path first
-            if os.path.exists(path):
-                return os.path.abspath(path)
-
-            # Try relative to base path
-            candidate = os.path.join(base_path, path)
-            if os.path.exists(candidate):
-                return os.path.abspath(candidate)
-
-            # Try in bundled location
-            if cls._is_bundled:
-                bundled_candidate = os.path.join(cls._get_base_path(), path)
-                if os.path.exists(bundled_candidate):
-                    return os.path.abspath(bundled_candidate)
-
-            Logger.error(f"Resource not found: {path}")
-            raise FileNotFoundError(f"Resource not found: {path}")
-
-        method.__name__ = f"get_in_{name}"
-        setattr(cls, method.__name__, MethodType(method, cls))
+    def _create_accessors(cls, name: str):
+        """Bind get_in_<name>(filename_or_path) and get_all_in_<name>() to `get`/`get_all`."""
+        setattr(cls, f"get_in_{name}", partial(cls.get, name))
+        setattr(cls, f"get_all_in_{name}", partial(cls.get_all, name))
 
     @classmethod
     def initialize(cls, cfg: Optional[dict] = None):
         if cfg is not None:
-            cls._cfg = {k.replace("RESOURCES_", "").lower(): v
-                        for k, v in cfg.items() if k.startswith("RESOURCES_")}
+            prefix, size = cls._CFG_PREFIX, len(cls._CFG_PREFIX)
+            cls._cfg = {k[size:].lower(): v for k, v in cfg.items() if k.startswith(prefix)}
         elif not hasattr(cls, "_cfg") or not cls._cfg:
             Logger.error("No configuration provided and Resources._cfg is empty!")
             return
 
-        base_path = cls._get_base_path()
+        # Normalized once; per-key paths are then built with plain string joins
+        base_path = str(cls._get_base_path())
+        cls.invalidate_resources()
 
         for key, path in cls._cfg.items():
             if key == "base":
-                setattr(cls, key, str(base_path))
+                setattr(cls, key, base_path)
                 continue
 
             # In bundled app, resources are directly in _internal/resources/subfolder
             if cls._is_bundled:
-                abs_path = base_path / key
+                abs_path = os.path.join(base_path, key)
+            elif os.path.isabs(path):
+                abs_path = path
             else:
-                abs_path = Path(path) if Path(path).is_absolute() else base_path / Path(path).name
+                abs_path = os.path.join(base_path, os.path.basename(os.path.normpath(path)))
 
-            setattr(cls, key, str(abs_path))
+            setattr(cls, key, abs_path)
+            cls._base_paths[key] = abs_path
 
-            # Only create directories in development mode
-            if not cls._is_bundled:
+            # Only create directories in development mode, once per process
+            if not cls._is_bundled and abs_path not in cls._ensured_dirs:
                 os.makedirs(abs_path, exist_ok=True)
+                cls._ensured_dirs.add(abs_path)
+
+            # Files are indexed lazily, on the first get_all() for this type
+            cls._index_locks.setdefault(key, threading.Lock())
+            cls._create_accessors(key)
+
+            Logger.debug(f"Registered {key} resources at: {abs_path}")
+
+    @classmethod
+    def invalidate_resources(cls):
+        """Forget all file indexes and memoized lookups; they are rebuilt on demand."""
+        cls.get.cache_clear()
+        cls._resources.clear()
+        cls._lookup.clear()
+
+    @classmethod
+    # Bundled resources never change at runtime, so their cache can be unbounded
+    @lru_cache(maxsize=None if _is_bundled else 1024)
+    def get(cls, kind: str, path: str) -> str:
+        """
+        Resolve `path` for resource type `kind` to an absolute path.
+
+        Results are memoized per (kind, path), so repeated lookups of the same asset
+        skip the join and existence checks. The cache is reset by `initialize()` and
+        `invalidate_resources()`.
+
+        In bundled apps the resources are fixed at build time and indexed from the
+        manifest, so no existence checks (`stat` calls) are made: an absolute path
+        is returned as is, then the index is consulted, then the path is taken as
+        relative to the resource directory; a missing file surfaces where it is
+        loaded. In development every candidate is checked on disk.
+
+        :param kind: Resource type (e.g. "qss", "icons")
+        :param path: File name or path, absolute or relative to the resource directory
+        :returns: Absolute path of the resource
+        :raises KeyError: If `kind` is not a configured resource type
+        :raises FileNotFoundError: If the resource cannot be found (development only)
+        """
+        base_path = cls._base_paths.get(kind)
+        if base_path is None:
+            Logger.error(f"Unknown resource type: {kind}")
+            raise KeyError(f"Unknown resource type: {kind}")
+
+        if cls._is_bundled and os.path.isabs(path):
+            return path
+
+        # Known file of this type: no filesystem access needed
+        hit = cls._path_index(kind).get(path)
+        if hit is not None:
+            return hit
+
+        if cls._is_bundled:
+            return os.path.normpath(os.path.join(base_path, path))
+
+        # Try direct path first (only a relative one needs the cwd to resolve)
+        if os.path.exists(path):
+            return os.path.normpath(path) if os.path.isabs(path) else os.path.abspath(path)
+
+        # Try relative to base path (already absolute, so no abspath needed)
+        candidate = os.path.join(base_path, path)
+        if os.path.exists(candidate):
+            return os.path.normpath(candidate)
+
+        Logger.error(f"Resource not found: {path}")
+        raise FileNotFoundError(f"Resource not found: {path}")
+
+    @classmethod
+    def get_all(cls, kind: Optional[str] = None):
+        """
+        Return the indexed files of one resource type, or of all types.
+
+        :param kind: Resource type; if omitted, the whole index is returned
+        :returns: List of files for `kind`, or a dict of all indexed resources
+        """
+        if kind is None:
+            # Directory walks are I/O bound (scandir releases the GIL), so the
+            # types not indexed yet are walked concurrently
+            pending = [name for name in cls._base_paths if name not in cls._resources]
+            if len(pending) > 1:
+                with ThreadPoolExecutor(max_workers=min(8, len(pending))) as pool:
+                    list(pool.map(cls._index, pending))
+            return {name: cls._index(name) for name in cls._base_paths}
+        if kind not in cls._base_paths:
+            return []
+        return cls._index(kind)
+
+    @classmethod
+    def _index(cls, kind: str) -> list[str]:
+        """Return the file index of a resource type, building it on first use."""
+        files = cls._resources.get(kind)
+        if files is not None:
+            return files
+
+        with cls._index_locks[kind]:
+            # Another thread may have indexed it while we waited
+            files = cls._resources.get(kind)
+            if files is None:
+                files = cls._manifest_files(kind)
+                if files is None:
+                    files = cls._list_files(cls._base_paths[kind])
+                cls._resources[kind] = files
+                Logger.debug(f"Indexed {len(files)} {kind} files from: {cls._base_paths[kind]}")
+        return files
+
+    @classmethod
+    def _manifest_files(cls, kind: str) -> Optional[list[str]]:
+        """
+        Return the files of a resource type from the build-time manifest.
+
+        Only bundled apps have a manifest; their resources are fixed at build time,
+        so reading it replaces walking the directory. Returns None when there is
+        no manifest or it does not list `kind`.
+        """
+        if not cls._is_bundled:
+            return None
+        if cls._manifest is None:
+            try:
+                with open(cls._get_base_path() / cls._MANIFEST_NAME, "rb") as f:
+                    cls._manifest = json.load(f)
+            except (OSError, ValueError) as e:
+                Logger.warning(f"Resource manifest unavailable, indexing from disk: {e}")
+                cls._manifest = {}
+
+        rel_paths = cls._manifest.get(kind)
+        if rel_paths is None:
+            return None
+        base_path = cls._base_paths[kind]
+        return [os.path.join(base_path, os.path.normpath(rel)) for rel in rel_paths]
+
+    @classmethod
+    def _path_index(cls, kind: str) -> dict[str, str]:
+        """
+        Return the lookup table of a resource type, building it on first use.
+
+        Each indexed file is reachable by its absolute path and by its path
+        relative to the resource directory (with "/" separators), the two forms
+        callers pass to `get()`.
+        """
+        lookup = cls._lookup.get(kind)
+        if lookup is None:
+            base_path = cls._base_paths[kind]
+            lookup = {}
+            for file in cls._index(kind):
+                lookup[file] = file
+                lookup[os.path.relpath(file, base_path).replace(os.sep, "/")] = file
+            cls._lookup[kind] = lookup
+        return lookup
+
+    @classmethod
+    def watch(cls):
+        """
+        Drop a type's file index whenever its resource directory changes.
+
+        Optional; uses a `QFileSystemWatcher`, so call it once the Qt application
+        exists. Only the top-level directory of each resource type is watched.
+        """
+        from PySide6.QtCore import QFileSystemWatcher
 
-            cls._resources[key] = cls._list_files(str(abs_path))
-            cls._create_get_all_method(key)
-            cls._create_get_method(key)
+        if cls._watcher is None:
+            cls._watcher = QFileSystemWatcher()
+            cls._watcher.directoryChanged.connect(cls._on_directory_changed)
 
-            Logger.debug(f"Indexed {len(cls._resources[key])} {key} files from: {abs_path}")
+        paths = [p for p in cls._base_paths.values() if os.path.isdir(p)]
+        if paths:
+            cls._watcher.addPaths(paths)
 
     @classmethod
-    def get_all(cls) -> dict[str, list[str]]:
-        """Return the dict of all indexed resources."""
-        return cls._resources
\ No newline at end of file
+    def _on_directory_changed(cls, path: str):
+        """Invalidate the index of the resource type rooted at `path`."""
+        for kind, base_path in cls._base_paths.items():
+            if base_path == path:
+                cls._resources.pop(kind, None)
+                cls._lookup.pop(kind, None)
+                cls.get.cache_clear()
+                Logger.debug(f"{kind} resources changed; index will be rebuilt")
\ No newline at end of file
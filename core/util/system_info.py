@@ -1,6 +1,11 @@
+import configparser
 import os
 import platform
+import plistlib
+import shutil
 import subprocess
+import time
+from functools import lru_cache
 from core.util.logger import Logger
 
 def detect_os_name() -> str:
@@ -12,9 +17,29 @@ IS_WINDOWS = OS_NAME == "Windows"
 IS_LINUX = OS_NAME == "Linux"
 IS_MACOS = OS_NAME == "Darwin"
 
+# Imported once here rather than inside detect_windows_theme() on every call
+if IS_WINDOWS:
+    import winreg
+else:
+    winreg = None
+
+
+_MACOS_GLOBAL_PREFS = os.path.expanduser("~/Library/Preferences/.GlobalPreferences.plist")
+
 
 def detect_macos_theme() -> bool:
-    """Detect dark mode on macOS."""
+    """
+    Detect dark mode on macOS.
+
+    Reads the global preferences plist in-process; `defaults` is only spawned
+    when the file cannot be read.
+    """
+    try:
+        with open(_MACOS_GLOBAL_PREFS, "rb") as f:
+            return plistlib.load(f).get("AppleInterfaceStyle") == "Dark"
+    except Exception:
+        pass
+
     try:
         result = subprocess.run(
             ["defaults", "read", "-g", "AppleInterfaceStyle"],
@@ -29,21 +54,38 @@ def detect_macos_theme() -> bool:
 def detect_windows_theme() -> bool:
     """Detect dark mode on Windows."""
     try:
-        import winreg
-        key = winreg.OpenKey(
+        with winreg.OpenKey(
             winreg.HKEY_CURRENT_USER,
             r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize"
-        )
-        val, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
-        winreg.CloseKey(key)
+        ) as key:
+            val, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
         return val == 0
     except Exception as e:
         Logger.warning(f"Windows theme detection failed: {e}")
         return False
 
 
+_LINUX_THEME_TTL = 30  # seconds a GTK/KDE detection result is reused
+
+
 def detect_linux_theme() -> bool:
-    """Detect dark theme from GTK/KDE."""
+    """
+    Detect dark theme from GTK/KDE.
+
+    Detection may fork a subprocess, so the result is reused for the current
+    ``_LINUX_THEME_TTL``-second time window (see :func:`clear_linux_theme_cache`).
+    """
+    return _detect_linux_theme(int(time.monotonic() // _LINUX_THEME_TTL))
+
+
+def clear_linux_theme_cache():
+    """Drop the cached GTK/KDE detection so the next call runs it again."""
+    _detect_linux_theme.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _detect_linux_theme(_window: int) -> bool:
+    """Uncached GTK/KDE detection; `_window` is the time bucket used as cache key."""
     if _detect_gtk_dark():
         return True
     if _detect_kde_dark():
@@ -63,8 +105,25 @@ def _detect_gtk_dark() -> bool:
         return False
 
 
+_KDE_GLOBALS = os.path.join(
+    os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config"), "kdeglobals"
+)
+
+
 def _detect_kde_dark() -> bool:
-    """Detect dark mode in KDE Plasma."""
+    """
+    Detect dark mode in KDE Plasma.
+
+    Parses ``kdeglobals`` in-process; `kreadconfig5` is only spawned when the
+    file cannot be read.
+    """
+    parser = configparser.ConfigParser(interpolation=None, strict=False)
+    try:
+        if parser.read(_KDE_GLOBALS, encoding="utf-8"):
+            return "dark" in parser.get("General", "ColorScheme", fallback="").lower()
+    except (configparser.Error, UnicodeDecodeError, OSError):
+        pass  # Unparsable or unreadable: ask kreadconfig5 instead
+
     try:
         result = subprocess.run(
             ["kreadconfig5", "--group", "General", "--key", "ColorScheme"],
@@ -86,60 +145,95 @@ def open_in_libreoffice(file_path: str) -> None:
         Logger.error(f"File does not exist: {file_path}")
         return
 
+    if _libreoffice_opener is None:
+        Logger.warning("Unsupported OS for LibreOffice.")
+        return
+
     try:
-        if IS_LINUX:
-            _open_libreoffice_linux(file_path)
-        elif IS_WINDOWS:
-            _open_libreoffice_windows(file_path)
-        elif IS_MACOS:
-            _open_libreoffice_macos(file_path)
-        else:
-            Logger.warning("Unsupported OS for LibreOffice.")
+        _libreoffice_opener(file_path)
     except Exception as e:
         Logger.error(f"Failed to open file in LibreOffice: {e}")
 
 
+_soffice_path: str | None = None  # LibreOffice binary found by _find_soffice()
+
+
+def _find_soffice(candidates) -> str | None:
+    """
+    Return the first available LibreOffice binary among `candidates`.
+
+    The first hit is remembered for the rest of the session, so later opens
+    launch it directly without probing. A miss is not cached, so a LibreOffice
+    installed while the app runs is still found.
+    """
+    global _soffice_path
+    if _soffice_path is None:
+        for candidate in candidates:
+            found = shutil.which(candidate)
+            if found:
+                _soffice_path = found
+                break
+    return _soffice_path
+
+
+def _launch_detached(cmd: list[str]) -> None:
+    """
+    Start `cmd` without tying it to this process.
+
+    Standard streams go to DEVNULL, so no pipes are kept open to it. On POSIX
+    the child also gets its own session, so it outlives the app.
+    """
+    subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=not IS_WINDOWS,
+    )
+
+
 def _open_libreoffice_linux(file_path: str) -> None:
     """Open a file in LibreOffice on Linux."""
-    commands = [
-        ["libreoffice", file_path],
-        ["soffice", file_path]
-    ]
-
-    for cmd in commands:
-        try:
-            subprocess.Popen(cmd)
-            Logger.info(f"Opened {file_path}")
-            return
-        except FileNotFoundError:
-            continue
+    soffice = _find_soffice(("libreoffice", "soffice"))
+    if soffice is None:
+        Logger.warning("LibreOffice not found on Linux (libreoffice/soffice not in PATH).")
+        return
 
-    Logger.warning("LibreOffice not found on Linux (libreoffice/soffice not in PATH).")
+    _launch_detached([soffice, file_path])
+    Logger.info(f"Opened {file_path}")
 
 
 def _open_libreoffice_windows(file_path: str) -> None:
     """Open a file in LibreOffice on Windows."""
-    possible_paths = [
+    soffice = _find_soffice((
         r"C:\Program Files\LibreOffice\program\soffice.exe",
         r"C:\Program Files (x86)\LibreOffice\program\soffice.exe"
-    ]
-
-    for soffice in possible_paths:
-        try:
-            subprocess.Popen([soffice, file_path])
-            Logger.info(f"Opened {file_path}")
-            return
-        except FileNotFoundError:
-            continue
+    ))
+    if soffice is None:
+        Logger.warning("LibreOffice not found on Windows.")
+        return
 
-    Logger.warning("LibreOffice not found on Windows.")
+    _launch_detached([soffice, file_path])
+    Logger.info(f"Opened {file_path}")
 
 
 def _open_libreoffice_macos(file_path: str) -> None:
     """Open a file in LibreOffice on macOS."""
-    soffice = "/Applications/LibreOffice.app/Contents/MacOS/soffice"
-    try:
-        subprocess.Popen([soffice, file_path])
-        Logger.info(f"Opened {file_path}")
-    except FileNotFoundError:
-        Logger.warning("LibreOffice not found on macOS.")
\ No newline at end of file
+    soffice = _find_soffice(("/Applications/LibreOffice.app/Contents/MacOS/soffice",))
+    if soffice is None:
+        Logger.warning("LibreOffice not found on macOS.")
+        return
+
+    _launch_detached([soffice, file_path])
+    Logger.info(f"Opened {file_path}")
+
+
+# OS-specific opener used by open_in_libreoffice(), chosen once at import
+if IS_LINUX:
+    _libreoffice_opener = _open_libreoffice_linux
+elif IS_WINDOWS:
+    _libreoffice_opener = _open_libreoffice_windows
+elif IS_MACOS:
+    _libreoffice_opener = _open_libreoffice_macos
+else:
+    _libreoffice_opener = None
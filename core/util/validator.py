@@ -1,8 +1,15 @@
-from pathlib import Path
+import os
+from functools import lru_cache
 from typing import Any
 
-from core.enums.app_themes import AppTheme
-from core.enums.log_level import LogLevel
+from core.enums.app_themes import AppTheme, APP_THEME_BY_VALUE
+from core.enums.log_level import LogLevel, LOG_LEVEL_BY_VALUE
+
+# Accepted (lowercase) boolean spellings for ConfigValidator.ensure_boolean
+_TRUTHY = frozenset(("true", "yes", "1", "on"))
+_FALSY = frozenset(("false", "no", "0", "off"))
+# Lowercase spelling → bool; the single table shared with `EnvironmentSetup._auto_cast`
+BOOL_BY_VALUE = {**dict.fromkeys(_TRUTHY, True), **dict.fromkeys(_FALSY, False)}
 
 
 class ConfigValidator:
@@ -49,6 +56,12 @@ class ConfigValidator:
         ValueError
             If the value cannot be converted to a positive integer.
         """
+        # Fast path for real ints (`type is` also rules out bool)
+        if type(value) is int:
+            if value > 0:
+                return value
+            raise ValueError(f"Invalid {field_name}: {value} - {field_name} must be positive")
+
         try:
             int_value = int(value)
             if int_value > 0:
@@ -91,10 +104,9 @@ class ConfigValidator:
         if isinstance(value, bool):
             return value
         if isinstance(value, str):
-            if value.lower() in ('true', 'yes', '1', 'on'):
-                return True
-            elif value.lower() in ('false', 'no', '0', 'off'):
-                return False
+            parsed = BOOL_BY_VALUE.get(value.lower())
+            if parsed is not None:
+                return parsed
         raise ValueError(f"Invalid {field_name}: {value}")
 
     @staticmethod
@@ -116,15 +128,20 @@ class ConfigValidator:
         str
             The value converted to string, or the default if the input is None.
         """
+        if type(value) is str:
+            return value
         if value is None:
             return default
         return str(value)
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def parse_log_level(level: str) -> LogLevel:
         """
         Parse a log level string and convert it into a LogLevel enum.
 
+        Results are memoized per input string (the set of values is tiny).
+
         Parameters
         ----------
         level : str
@@ -140,16 +157,19 @@ class ConfigValidator:
         ValueError
             If the string does not correspond to any LogLevel.
         """
-        try:
-            return LogLevel(level.upper())
-        except ValueError:
+        member = LOG_LEVEL_BY_VALUE.get(level.upper())
+        if member is None:
             raise ValueError(f"Invalid log level: {level}")
+        return member
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def parse_theme_mode(mode: str) -> AppTheme:
         """
         Parse a theme mode string and convert it into an AppTheme enum.
 
+        Results are memoized per input string (the set of values is tiny).
+
         Parameters
         ----------
         mode : str
@@ -165,10 +185,10 @@ class ConfigValidator:
         ValueError
             If the string does not match any available AppTheme.
         """
-        try:
-            return AppTheme(mode.upper())
-        except ValueError:
+        member = APP_THEME_BY_VALUE.get(mode.upper())
+        if member is None:
             raise ValueError(f"Invalid theme mode: {mode}")
+        return member
 
     @staticmethod
     def validate_file_path(path: str, must_exist: bool = False) -> str:
@@ -185,17 +205,16 @@ class ConfigValidator:
         Returns
         -------
         str
-            The absolute, normalized file path.
+            The validated path, as given (callers pass resolved paths).
 
         Raises
         ------
         ValueError
             If the file must exist but does not.
         """
-        path_obj = Path(path)
-        if must_exist and not path_obj.exists():
+        if must_exist and not os.path.exists(path):
             raise ValueError(f"File not found: {path}")
-        return str(path_obj)
+        return os.fspath(path)
 
     @staticmethod
     def validate_directory_path(path: str, create_if_missing: bool = False) -> str:
@@ -212,14 +231,14 @@ class ConfigValidator:
         Returns
         -------
         str
-            The absolute, normalized directory path.
+            The validated path, as given (callers pass resolved paths).
 
         Raises
         ------
         ValueError
             If the path is invalid and cannot be created.
         """
-        path_obj = Path(path)
-        if create_if_missing and not path_obj.exists():
-            path_obj.mkdir(parents=True, exist_ok=True)
-        return str(path_obj)
+        # One stat in the common (existing) case; makedirs would try mkdir first
+        if create_if_missing and not os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
+        return os.fspath(path)
@@ -1,4 +1,6 @@
-from PySide6.QtWidgets import QMainWindow, QStackedWidget
+from functools import partial
+
+from PySide6.QtWidgets import QMainWindow, QStackedWidget, QWidget
 
 from core.manager.theme_manager import ThemeManager
 from core.util.logger import Logger
@@ -10,6 +12,7 @@ from gui.stages.stage3 import Stage3
 class MainWindow(QMainWindow):
     """Main window that manages multiple stages (1–3)."""
     initial_stage_index: int = 1
+    _STAGE_CLASSES = {1: Stage1, 2: Stage2, 3: Stage3}  # 1-based stage index → class
 
     def __init__(self, config: dict):
         super().__init__()
@@ -27,26 +30,37 @@ class MainWindow(QMainWindow):
         self.stage_manager = QStackedWidget()
         self.setCentralWidget(self.stage_manager)
 
-        # Instantiate all stages
-        self.stage1 = Stage1(self.config)
-        self.stage2 = Stage2(self.config)
-        self.stage3 = Stage3(self.config)
-
-        # Add to manager
-        self.stage_manager.addWidget(self.stage1)
-        self.stage_manager.addWidget(self.stage2)
-        self.stage_manager.addWidget(self.stage3)
-
-        # Connect navigation
-        self.stage1.next_stage.connect(lambda: self.goto_stage(2))
-        self.stage2.prev_stage.connect(lambda: self.goto_stage(1))
-        self.stage2.next_stage.connect(lambda: self.goto_stage(3))
-        self.stage3.prev_stage.connect(lambda: self.goto_stage(2))
+        # Stages are built on first visit (see `_get_stage`); only the initial
+        # one is constructed at startup
+        self._stages: dict[int, QWidget] = {}
 
         # Start at Stage 1
         self.goto_stage(self.initial_stage_index)
 
+    def _get_stage(self, index: int) -> QWidget:
+        """Return the stage at `index`, building and registering it on first use."""
+        stage = self._stages.get(index)
+        if stage is None:
+            stage = self._STAGE_CLASSES[index](self.config)
+            self.stage_manager.addWidget(stage)
+
+            self._connect_navigation(stage, index)
+            self._stages[index] = stage
+            Logger.debug(f"Built Stage {index}")
+        return stage
+
+    def _connect_navigation(self, stage: QWidget, index: int):
+        """Wire a stage's next/prev signals to the neighbouring stages."""
+        # `partial` objects are C callables (no Python frame per emit, unlike a lambda).
+        # The first/last stage have no neighbour on one side: that signal stays unwired.
+        if index + 1 in self._STAGE_CLASSES:
+            stage.next_stage.connect(partial(self.goto_stage, index + 1))
+        if index - 1 in self._STAGE_CLASSES:
+            stage.prev_stage.connect(partial(self.goto_stage, index - 1))
+
     def goto_stage(self, index: int):
-        """Switch to a specific stage (1-based index)."""
-        self.stage_manager.setCurrentIndex(index - 1)
+        """Switch to a specific stage (1-based index); unknown indices are ignored."""
+        if index not in self._STAGE_CLASSES:
+            return
+        self.stage_manager.setCurrentWidget(self._get_stage(index))
         Logger.debug(f"Switched to Stage {index}")
@@ -42,9 +42,9 @@ class BaseStage(QWidget):
         # Title
         self.main_layout.addWidget(UIFactory.create_label(self.title))
 
-        # Content Area - to be populated by subclasses
-        self.content_layout = QVBoxLayout()
-        self.main_layout.addLayout(self.content_layout)
+        # Content Area - to be populated by subclasses through `add_content`.
+        # Widgets go straight into main_layout (no nested layout), at this index.
+        self.content_index = self.main_layout.count()
 
         # Spacer to push buttons to bottom
         self.main_layout.addStretch(1)
@@ -55,6 +55,15 @@ class BaseStage(QWidget):
         self.nav_layout.setSpacing(20)
         self.main_layout.addLayout(self.nav_layout)
 
+    def add_content(self, widget: QWidget) -> None:
+        """
+        Add a widget to the content area (below the title, above the navigation bar).
+
+        :param widget: The widget to add
+        """
+        self.main_layout.insertWidget(self.content_index, widget)
+        self.content_index += 1
+
     def add_nav_buttons(self, back_text: Optional[str] = None, next_text: Optional[str] = None) -> None:
         """
         Adds navigation buttons to the bottom of the stage.
@@ -62,17 +71,22 @@ class BaseStage(QWidget):
         :param back_text: Text for the back button (None hides the button)
         :param next_text: Text for the next button (None hides the button)
         """
-        # Back button (left aligned)
-        if back_text:
-            back_btn = UIFactory.create_button(back_text, self.prev_stage.emit)
-            self.nav_layout.addWidget(back_btn)
-
-        # Spacer pushes Next button to the right
-        self.nav_layout.addSpacerItem(
-            QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
-        )
-
-        # Next button (right aligned)
-        if next_text:
-            next_btn = UIFactory.create_button(next_text, self.next_stage.emit)
-            self.nav_layout.addWidget(next_btn)
\ No newline at end of file
+        # Batch the additions: the widget repaints once, after all buttons are in place
+        self.setUpdatesEnabled(False)
+        try:
+            # Back button (left aligned)
+            if back_text:
+                back_btn = UIFactory.create_button(back_text, self.prev_stage.emit)
+                self.nav_layout.addWidget(back_btn)
+
+            # Spacer pushes Next button to the right
+            self.nav_layout.addSpacerItem(
+                QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+            )
+
+            # Next button (right aligned)
+            if next_text:
+                next_btn = UIFactory.create_button(next_text, self.next_stage.emit)
+                self.nav_layout.addWidget(next_btn)
+        finally:
+            self.setUpdatesEnabled(True)
@@ -1,20 +1,32 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QFileDialog, QMessageBox, QLabel
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal, Slot
 from PySide6.QtGui import QDragEnterEvent, QDropEvent
 import os
-import mimetypes
 
 from core.manager.theme_manager import ThemeManager
 from core.util.logger import Logger
 from core.util.resources import Resources
 
+# MIME types of the default allowed extensions, shown without consulting `mimetypes`
+_MIME_BY_EXT = {
+    ".txt": "text/plain",
+    ".pdf": "application/pdf",
+    ".doc": "application/msword",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+}
+
 
 class DragDrop:
     """
     Creates a drag-drop area that supports click and drag-drop operations.
     """
+    _QSS_PATH: str = None  # Resolved on first use (Resources must be initialized)
+
     def create_drag_drop_area(self, width, height, allowed_extensions=None, on_files_selected=None):
         if allowed_extensions is None:
             allowed_extensions = ['.txt', '.pdf', '.doc', '.docx', '.png', '.jpg', '.jpeg']
@@ -26,7 +38,8 @@ class DragDrop:
         widget.setAcceptDrops(True)
 
         widget.on_files_selected = on_files_selected
-        widget.allowed_extensions = [ext.lower() for ext in allowed_extensions]
+        widget.drag_state = ""  # Last "dragState" applied, see _set_drag_state()
+        widget.allowed_extensions = frozenset(ext.lower() for ext in allowed_extensions)
 
         # Label for drag-drop area
         label = QLabel("📁 Click to browse files\nor drag & drop files here", widget)
@@ -39,7 +52,9 @@ class DragDrop:
         layout.addWidget(label)
         layout.setAlignment(Qt.AlignCenter)
 
-        ThemeManager.apply_theme_to_widget(widget, Resources.get_in_qss("drag_drop/default.qss"))
+        if DragDrop._QSS_PATH is None:
+            DragDrop._QSS_PATH = Resources.get_in_qss("drag_drop/default.qss")
+        ThemeManager.apply_theme_to_widget(widget, DragDrop._QSS_PATH)
 
         # Mouse press event (open file dialog)
         def mouse_press_event(event):
@@ -61,7 +76,7 @@ class DragDrop:
             widget,
             "Select Files",
             "",
-            f"Allowed files ({' '.join(['*' + ext for ext in widget.allowed_extensions])})"
+            f"Allowed files ({' '.join('*' + ext for ext in sorted(widget.allowed_extensions))})"
         )
         if files:
             valid_files = self._filter_files_by_extension(files, widget.allowed_extensions)
@@ -71,40 +86,81 @@ class DragDrop:
                 self._show_error_dialog(widget, "No valid files selected")
 
     def _drag_enter_event(self, widget, event: QDragEnterEvent):
-        if event.mimeData().hasUrls():
-            urls = event.mimeData().urls()
-            valid_files = [
-                url.toLocalFile() for url in urls
-                if url.isLocalFile() and os.path.splitext(url.toLocalFile())[1].lower() in widget.allowed_extensions
-            ]
-            if valid_files:
+        mime_data = event.mimeData()
+        if mime_data.hasUrls():
+            # Fires repeatedly during a drag: stop at the first acceptable file.
+            # Directories are accepted too; their files are scanned on drop.
+            allowed_extensions = widget.allowed_extensions
+            has_valid_file = False
+            for url in mime_data.urls():
+                if not url.isLocalFile():
+                    continue
+                path = url.toLocalFile()
+                if os.path.splitext(path)[1].lower() in allowed_extensions or os.path.isdir(path):
+                    has_valid_file = True
+                    break
+            if has_valid_file:
                 event.acceptProposedAction()
-                widget.setProperty("dragState", "valid")
+                self._set_drag_state(widget, "valid")
             else:
                 event.ignore()
-                widget.setProperty("dragState", "invalid")
-            widget.style().polish(widget)  # Refresh QSS
+                self._set_drag_state(widget, "invalid")
         else:
             event.ignore()
 
     def _drop_event(self, widget, event: QDropEvent):
-        widget.setProperty("dragState", "")  # Reset to normal
-        widget.style().polish(widget)
+        self._set_drag_state(widget, "")  # Reset to normal
 
         if event.mimeData().hasUrls():
-            files = [
-                url.toLocalFile() for url in event.mimeData().urls()
-                if url.isLocalFile() and os.path.isfile(url.toLocalFile())
-            ]
-            if files:
-                valid_files = self._filter_files_by_extension(files, widget.allowed_extensions)
-                if valid_files:
-                    self._process_selected_files(widget, valid_files)
-                else:
-                    self._show_error_dialog(widget, "No files with allowed extensions were dropped")
+            files, directories = [], []
+            for url in event.mimeData().urls():
+                if url.isLocalFile():
+                    path = url.toLocalFile()
+                    if os.path.isfile(path):
+                        files.append(path)
+                    elif os.path.isdir(path):
+                        directories.append(path)
+
+            if directories:
+                # Dropped folders can hold many files: walk them off the GUI thread
+                receiver = getattr(widget, "_scan_receiver", None)
+                if receiver is None:
+                    receiver = widget._scan_receiver = _ScanReceiver(
+                        lambda found: self._on_files_dropped(widget, found), widget
+                    )
+                QThreadPool.globalInstance().start(
+                    _DirectoryScan(directories, files, widget.allowed_extensions, receiver.files_found)
+                )
+            elif files:
+                self._on_files_dropped(widget, files)
 
             event.acceptProposedAction()
 
+    def _on_files_dropped(self, widget, files):
+        """Handle the files of a drop (GUI thread)."""
+        if not files:
+            return
+        valid_files = self._filter_files_by_extension(files, widget.allowed_extensions)
+        if valid_files:
+            self._process_selected_files(widget, valid_files)
+        else:
+            self._show_error_dialog(widget, "No files with allowed extensions were dropped")
+
+    def _set_drag_state(self, widget, state: str):
+        """
+        Set the "dragState" QSS property, re-polishing only when it changes.
+
+        Polishing re-resolves the widget's stylesheet, and drag-enter can fire
+        several times per drag with the same outcome.
+        """
+        if state == widget.drag_state:
+            return
+        widget.drag_state = state
+        widget.setProperty("dragState", state)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)  # Refresh QSS
+
     def _drag_move_event(self, widget, event):
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
@@ -118,7 +174,7 @@ class DragDrop:
         label = widget.drag_label
         if len(files) == 1:
             file_name = os.path.basename(files[0])
-            mime_type, _ = mimetypes.guess_type(files[0])
+            mime_type = self._guess_mime_type(files[0])
             label.setText(f"✅ <b>{file_name}</b><br><i>{mime_type or 'Unknown type'}</i>")
         else:
             label.setText(f"✅ {len(files)} files selected")
@@ -128,5 +184,71 @@ class DragDrop:
         else:
             print(f"Selected files: {files}")
 
+    @staticmethod
+    def _guess_mime_type(path: str) -> str | None:
+        """
+        Return the MIME type of `path` from its extension.
+
+        Known extensions are a dict lookup. Only other extensions import
+        `mimetypes`, which reads the system MIME tables on first use.
+        """
+        ext = os.path.splitext(path)[1].lower()
+        mime_type = _MIME_BY_EXT.get(ext)
+        if mime_type is None:
+            import mimetypes
+            mime_type, _ = mimetypes.guess_type(path)
+        return mime_type
+
     def _show_error_dialog(self, widget, message):
         QMessageBox.warning(widget, "Invalid Files", message)
+
+
+class _ScanReceiver(QObject):
+    """
+    GUI-thread end of a `_DirectoryScan`.
+
+    Results are emitted from a worker thread; because this object lives in the
+    GUI thread, they are queued and `callback` runs there.
+    """
+    files_found = Signal(list)
+
+    def __init__(self, callback, parent=None):
+        super().__init__(parent)
+        self._callback = callback
+        self.files_found.connect(self._deliver)
+
+    @Slot(list)
+    def _deliver(self, files):
+        self._callback(files)
+
+
+class _DirectoryScan(QRunnable):
+    """Collects the files with allowed extensions under dropped directories."""
+
+    def __init__(self, directories, files, allowed_extensions, result_signal):
+        super().__init__()
+        self._directories = directories
+        self._files = files  # Plain files of the same drop, reported together
+        self._allowed_extensions = allowed_extensions
+        self._result_signal = result_signal
+
+    def run(self):
+        allowed_extensions = self._allowed_extensions
+        found = list(self._files)
+        pending = list(self._directories)
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        # DirEntry already knows its type and name: no stat, no path split
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif (entry.is_file(follow_symlinks=False)
+                              and os.path.splitext(entry.name)[1].lower() in allowed_extensions):
+                            found.append(entry.path)
+            except OSError:
+                continue
+        try:
+            self._result_signal.emit(found)
+        except RuntimeError:
+            pass  # The drop area was destroyed during the scan
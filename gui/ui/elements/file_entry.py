@@ -1,8 +1,8 @@
 import os
 
 from PySide6.QtWidgets import QWidget, QLabel, QHBoxLayout, QVBoxLayout, QPushButton, QMenu, QSizePolicy
-from PySide6.QtGui import QPixmap, QAction
-from PySide6.QtCore import Qt
+from PySide6.QtGui import QPixmap, QPixmapCache, QAction
+from PySide6.QtCore import Qt, QFile
 
 from core.util.resources import Resources
 from core.util.logger import Logger
@@ -10,23 +10,30 @@ from core.util.logger import Logger
 class FileEntry(QWidget):
     """
     Generic file-entry row with default icon, showing file name, size, and a menu.
+
+    No `__slots__`: Shiboken wrappers always carry an instance `__dict__`, so slots
+    would not save memory. For many files, use `FileListView` instead.
     """
     DEFAULT_ICON, ERROR_ICON = None, None
+    _DEFAULT_ICON_EXISTS, _ERROR_ICON_EXISTS = False, False  # Checked once, with the paths
+    _SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
 
     def __init__(self, file_path: str, on_edit=None, on_delete=None, parent=None, show_error_if_missing=True):
         super().__init__(parent)
 
         # Lazy-load class-level icons if not already loaded
-        if self.__class__.DEFAULT_ICON is None:
-            self.__class__.DEFAULT_ICON = Resources.get_in_icons("sys/default_file_entry.png")
-        if self.__class__.ERROR_ICON is None:
-            self.__class__.ERROR_ICON = Resources.get_in_icons("sys/error.png")
+        self._load_icons()
 
         self.file_path = file_path
         self.show_error_if_missing = show_error_if_missing
 
-        # Determine if the file exists
-        self.file_exists = os.path.exists(file_path)
+        # Determine if the file exists (one stat, which also gives the size)
+        try:
+            self._size_bytes = os.stat(file_path).st_size
+            self.file_exists = True
+        except (OSError, ValueError):
+            self._size_bytes = 0
+            self.file_exists = False
         if self.show_error_if_missing and not self.file_exists:
             self.file_name = "File not found !"
             Logger.error(f"File not found for path: '{self.file_path}'")
@@ -39,6 +46,10 @@ class FileEntry(QWidget):
         self._build_ui()
 
     def _build_ui(self):
+        # Instance attributes read more than once, bound to locals
+        file_name, file_path = self.file_name, self.file_path
+        on_edit, on_delete = self.on_edit, self.on_delete
+
         layout = QHBoxLayout(self)
         layout.setContentsMargins(12, 8, 12, 8)
         layout.setSpacing(12)
@@ -48,32 +59,18 @@ class FileEntry(QWidget):
         icon_label.setFixedSize(64, 64)
 
         # Show error icon if file is missing and flag is True
-        icon_path = self.ERROR_ICON if self.show_error_if_missing and not self.file_exists else self.DEFAULT_ICON
-        pix = QPixmap(icon_path) if os.path.exists(icon_path) else QPixmap(64, 64)
-        if pix.isNull():
-            pix = QPixmap(64, 64)
-            pix.fill(Qt.darkGray)
-        else:
-            pix = pix.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-
-        icon_label.setPixmap(pix)
+        icon_label.setPixmap(self.icon_pixmap(self.show_error_if_missing and not self.file_exists))
 
         # ========== TEXT ==========
         text_container = QVBoxLayout()
         text_container.setSpacing(2)
 
-        name_label = QLabel(self.file_name)
-        name_label.setToolTip(self.file_name)
+        name_label = QLabel(file_name)
+        name_label.setToolTip(file_name)
         name_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
 
-        # File size
-        size_bytes = 0
-        if self.file_exists:
-            try:
-                size_bytes = os.path.getsize(self.file_path)
-            except Exception:
-                Logger.warning(f"Could not get size for: {self.file_path}")
-        size_label = QLabel(self._format_size(size_bytes))
+        # File size (read by the stat in __init__)
+        size_label = QLabel(self.format_size(self._size_bytes))
         size_label.setStyleSheet("font-size: 11px; opacity: 0.6;")
 
         text_container.addWidget(name_label)
@@ -93,10 +90,10 @@ class FileEntry(QWidget):
             lambda: menu.exec_(menu_button.mapToGlobal(menu_button.rect().bottomLeft()))
         )
 
-        if self.on_edit:
-            action_edit.triggered.connect(lambda: self.on_edit(self.file_path))
-        if self.on_delete:
-            action_delete.triggered.connect(lambda: self.on_delete(self.file_path))
+        if on_edit:
+            action_edit.triggered.connect(lambda: on_edit(file_path))
+        if on_delete:
+            action_delete.triggered.connect(lambda: on_delete(file_path))
 
         # ========== ASSEMBLE ==========
         layout.addWidget(icon_label)
@@ -104,12 +101,63 @@ class FileEntry(QWidget):
         layout.addStretch()
         layout.addWidget(menu_button)
 
-    def _format_size(self, size_bytes):
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size_bytes < 1024:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024
-        return f"{size_bytes:.1f} TB"
+    @classmethod
+    def _load_icons(cls):
+        """Resolve the default/error icon paths (and whether they exist) once."""
+        if FileEntry.DEFAULT_ICON is None:
+            FileEntry.DEFAULT_ICON, FileEntry._DEFAULT_ICON_EXISTS = cls._resolve_icon("sys/default_file_entry.png")
+        if FileEntry.ERROR_ICON is None:
+            FileEntry.ERROR_ICON, FileEntry._ERROR_ICON_EXISTS = cls._resolve_icon("sys/error.png")
+
+    @staticmethod
+    def _resolve_icon(name: str) -> tuple[str, bool]:
+        """
+        Return the path of an icon and whether it exists.
+
+        Icons compiled into the Qt resources (`resources.qrc`, bundled builds) are
+        served from memory, so no file is looked up; otherwise the icon is read
+        from the icons resource directory.
+        """
+        qt_path = f":/icons/{name}"
+        if QFile.exists(qt_path):
+            return qt_path, True
+        path = Resources.get_in_icons(name)
+        return path, os.path.exists(path)
+
+    @classmethod
+    def icon_pixmap(cls, error: bool) -> QPixmap:
+        """
+        Return the scaled default or error icon.
+
+        Scaled icons are kept in the application-wide `QPixmapCache`, so each is
+        decoded and scaled once and every row (in any stage) shares the same
+        pixel data. If Qt evicts an entry it is simply rebuilt.
+        """
+        key = "file_entry:error:64" if error else "file_entry:default:64"
+        pix = QPixmapCache.find(key)
+        if pix is not None and not pix.isNull():
+            return pix
+
+        cls._load_icons()
+        icon_path, icon_exists = ((cls.ERROR_ICON, cls._ERROR_ICON_EXISTS) if error
+                                  else (cls.DEFAULT_ICON, cls._DEFAULT_ICON_EXISTS))
+        pix = QPixmap(icon_path) if icon_exists else QPixmap(64, 64)
+        if pix.isNull():
+            pix = QPixmap(64, 64)
+            pix.fill(Qt.darkGray)
+        else:
+            pix = pix.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+        QPixmapCache.insert(key, pix)
+        return pix
+
+    @staticmethod
+    def format_size(size_bytes: int) -> str:
+        """Format a byte count with a binary unit (e.g. "1.5 MB")."""
+        # Unit index straight from the magnitude: each unit spans 10 bits
+        units = FileEntry._SIZE_UNITS
+        unit = min((max(size_bytes, 1).bit_length() - 1) // 10, len(units) - 1)
+        return f"{size_bytes / (1 << (10 * unit)):.1f} {units[unit]}"
 
     def paintEvent(self, event):
         super().paintEvent(event)
@@ -0,0 +1,163 @@
+import os
+
+from PySide6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QMenu, QAbstractItemView
+from PySide6.QtGui import QAction, QFont
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QSize
+
+from gui.ui.elements.file_entry import FileEntry
+
+
+class FileListModel(QAbstractListModel):
+    """
+    List model of file paths, rendered like `FileEntry` rows by `FileEntryDelegate`.
+
+    Unlike one `FileEntry` widget per file, only the rows that are visible get
+    painted, and each file is stat-ed once, the first time its row is shown.
+    """
+    SizeRole = Qt.UserRole + 1  # Formatted size, e.g. "1.5 MB"
+    PathRole = Qt.UserRole + 2  # Full file path
+
+    def __init__(self, paths=None, parent=None):
+        super().__init__(parent)
+        self._paths: list[str] = list(paths or [])
+        self._sizes: dict[str, int | None] = {}  # path → size in bytes (None if missing)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._paths)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        path = self._paths[index.row()]
+
+        if role == Qt.DisplayRole:
+            return os.path.basename(path) if self._size(path) is not None else "File not found !"
+        if role == self.SizeRole:
+            return FileEntry.format_size(self._size(path) or 0)
+        if role == Qt.DecorationRole:
+            return FileEntry.icon_pixmap(self._size(path) is None)
+        if role in (Qt.ToolTipRole, self.PathRole):
+            return path
+        return None
+
+    def _size(self, path: str) -> int | None:
+        """Size of `path` in bytes, or None if it does not exist (stat-ed once)."""
+        try:
+            return self._sizes[path]
+        except KeyError:
+            try:
+                size = os.stat(path).st_size
+            except (OSError, ValueError):
+                size = None
+            self._sizes[path] = size
+            return size
+
+    def add_files(self, paths):
+        """Append files to the list (usable directly as a drag-drop `on_files_selected`)."""
+        if not paths:
+            return
+        first = len(self._paths)
+        self.beginInsertRows(QModelIndex(), first, first + len(paths) - 1)
+        self._paths.extend(paths)
+        self.endInsertRows()
+
+    def remove_file(self, path: str):
+        """Remove the first row showing `path`, if any."""
+        try:
+            row = self._paths.index(path)
+        except ValueError:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._paths[row]
+        self.endRemoveRows()
+        if path not in self._paths:
+            self._sizes.pop(path, None)
+
+    def paths(self) -> list[str]:
+        """Return a copy of the listed paths."""
+        return list(self._paths)
+
+
+class FileEntryDelegate(QStyledItemDelegate):
+    """Paints a `FileListModel` row: icon, file name, size, and a menu glyph."""
+    ROW_HEIGHT = 80
+    ICON_SIZE = 64
+    MARGIN = 12
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        style = option.widget.style() if option.widget else None
+        if style:
+            style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+
+        rect = option.rect
+        icon_rect = QRect(rect.left() + self.MARGIN, rect.top() + (rect.height() - self.ICON_SIZE) // 2,
+                          self.ICON_SIZE, self.ICON_SIZE)
+        painter.drawPixmap(icon_rect, index.data(Qt.DecorationRole))
+
+        text_left = icon_rect.right() + self.MARGIN
+        text_width = rect.right() - self.MARGIN - 28 - text_left
+        half = rect.height() // 2
+
+        name_font = QFont(option.font)
+        name_font.setPointSizeF(name_font.pointSizeF() * 1.2)
+        painter.setFont(name_font)
+        name = painter.fontMetrics().elidedText(index.data(Qt.DisplayRole), Qt.ElideMiddle, text_width)
+        painter.drawText(QRect(text_left, rect.top(), text_width, half), Qt.AlignLeft | Qt.AlignBottom, name)
+
+        size_font = QFont(option.font)
+        size_font.setPointSizeF(size_font.pointSizeF() * 0.8)
+        painter.setFont(size_font)
+        painter.setOpacity(0.6)
+        painter.drawText(QRect(text_left, rect.top() + half + 2, text_width, half - 2),
+                         Qt.AlignLeft | Qt.AlignTop, index.data(FileListModel.SizeRole))
+        painter.setOpacity(1.0)
+
+        painter.drawText(QRect(rect.right() - self.MARGIN - 28, rect.top(), 28, rect.height()),
+                         Qt.AlignCenter, "▼")
+        painter.restore()
+
+
+class FileListView(QListView):
+    """
+    Scrollable list of files backed by `FileListModel`.
+
+    Rows offer the same Edit / Hide menu as `FileEntry` (on right-click). "Hide"
+    removes the row; both actions also call the optional callbacks with the path.
+    """
+
+    def __init__(self, paths=None, on_edit=None, on_delete=None, parent=None):
+        super().__init__(parent)
+        self.on_edit = on_edit
+        self.on_delete = on_delete
+
+        self.file_model = FileListModel(paths, self)
+        self.setModel(self.file_model)
+        self.setItemDelegate(FileEntryDelegate(self))
+        self.setUniformItemSizes(True)  # Lets the view skip per-row size hints
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.customContextMenuRequested.connect(self._show_menu)
+
+    def _show_menu(self, pos):
+        index = self.indexAt(pos)
+        if not index.isValid():
+            return
+        path = index.data(FileListModel.PathRole)
+
+        menu = QMenu(self)
+        action_edit = QAction("✏️ Edit", menu)
+        action_delete = QAction("⛔ Hide", menu)
+        menu.addAction(action_edit)
+        menu.addAction(action_delete)
+
+        chosen = menu.exec(self.viewport().mapToGlobal(pos))
+        if chosen is action_edit and self.on_edit:
+            self.on_edit(path)
+        elif chosen is action_delete:
+            self.file_model.remove_file(path)
+            if self.on_delete:
+                self.on_delete(path)
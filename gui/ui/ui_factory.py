@@ -1,10 +1,24 @@
-from PySide6.QtGui import QAction
+from functools import lru_cache
+
+from PySide6.QtGui import QAction, QKeySequence
 from PySide6.QtWidgets import (
     QWidget, QLabel, QPushButton, QMenuBar, QMenu
 )
 from PySide6.QtCore import Qt
 
+from gui.ui.elements.drag_drop import DragDrop
 from gui.ui.elements.file_entry import FileEntry
+from gui.ui.elements.file_list_view import FileListView
+
+
+@lru_cache(maxsize=256)
+def _key_sequence(shortcut: str) -> QKeySequence:
+    """Parse a shortcut string once; rebuilt menus reuse the `QKeySequence`."""
+    return QKeySequence(shortcut)
+
+
+# Widgets created with a `key`, reused by later calls with the same key
+_WIDGET_POOL: dict[tuple[str, type], QWidget] = {}
 
 
 class UIFactory:
@@ -17,7 +31,7 @@ class UIFactory:
 
     @staticmethod
     def create_label(text: str, align: Qt.AlignmentFlag = Qt.AlignCenter,
-                     tooltip: str = None, stylesheet: str = None) -> QLabel:
+                     tooltip: str = None, stylesheet: str = None, key: str = None) -> QLabel:
         """
         Creates a styled QLabel with optional alignment, tooltip, and custom styling.
 
@@ -25,10 +39,16 @@ class UIFactory:
         :param align: Text alignment. Defaults to Qt.AlignCenter
         :param tooltip: Tooltip text to show on hover
         :param stylesheet: Custom CSS stylesheet for the label
+        :param key: Optional pool key; a live label created with the same key is
+            reconfigured and returned instead of building a new one
 
         :returns:QLabel: Configured label widget
         """
-        label = QLabel(text)
+        label = UIFactory._from_pool(key, QLabel)
+        if label is None:
+            label = UIFactory._add_to_pool(key, QLabel(text))
+        else:
+            label.setText(text)
         label.setAlignment(align)
 
         if tooltip:
@@ -42,7 +62,7 @@ class UIFactory:
     @staticmethod
     def create_button(text: str, on_click: callable = None, tooltip: str = None,
                       min_width: int = 120, enabled: bool = True,
-                      stylesheet: str = None) -> QPushButton:
+                      stylesheet: str = None, key: str = None) -> QPushButton:
         """
         Creates a styled QPushButton with consistent sizing and optional styling.
 
@@ -52,10 +72,20 @@ class UIFactory:
         :param min_width: Minimum button width in pixels. Defaults to 120
         :param enabled: Whether the button is initially enabled. Defaults to True
         :param stylesheet: Custom CSS stylesheet for the button
+        :param key: Optional pool key; a live button created with the same key is
+            reconfigured (previous click handlers removed) and returned
 
         :returns:Configured button widget
         """
-        btn = QPushButton(text)
+        btn = UIFactory._from_pool(key, QPushButton)
+        if btn is None:
+            btn = UIFactory._add_to_pool(key, QPushButton(text))
+        else:
+            btn.setText(text)
+            try:
+                btn.clicked.disconnect()
+            except (RuntimeError, TypeError):
+                pass  # No handler connected
 
         if on_click:
             btn.clicked.connect(on_click)
@@ -71,6 +101,36 @@ class UIFactory:
 
         return btn
 
+    @staticmethod
+    def _from_pool(key: str | None, widget_type: type) -> QWidget | None:
+        """
+        Return the pooled widget for `key`, reset to its defaults, or None.
+
+        Only the tooltip and stylesheet are reset here; the caller sets the rest.
+        """
+        if key is None:
+            return None
+        widget = _WIDGET_POOL.get((key, widget_type))
+        if widget is not None:
+            widget.setToolTip("")
+            widget.setStyleSheet("")
+        return widget
+
+    @staticmethod
+    def _add_to_pool(key: str | None, widget: QWidget) -> QWidget:
+        """Register `widget` under `key` (if any) until it is destroyed."""
+        if key is not None:
+            pool_key = (key, type(widget))
+            _WIDGET_POOL[pool_key] = widget
+            # Qt deletes a widget with its parent: drop it before it can be handed out
+            widget.destroyed.connect(lambda *_: _WIDGET_POOL.pop(pool_key, None))
+        return widget
+
+    @staticmethod
+    def clear_pool() -> None:
+        """Forget all pooled widgets (they stay alive while their parents hold them)."""
+        _WIDGET_POOL.clear()
+
     @staticmethod
     def create_menu_bar(menu_structure: dict, parent: QWidget) -> QMenuBar:
         """
@@ -91,76 +151,116 @@ class UIFactory:
         if not menu_structure:
             raise ValueError("Menu structure cannot be empty")
 
-        menubar = QMenuBar(parent)
+        # Validate every entry first, so building the menus is only Qt calls
+        structure = [
+            (menu_name, UIFactory._normalize_actions(actions))
+            for menu_name, actions in menu_structure.items() if actions
+        ]
 
-        for menu_name, actions in menu_structure.items():
-            if not actions:
-                continue
+        menubar = QMenuBar(parent)
+        add_menu = menubar.addMenu
 
+        for menu_name, actions in structure:
             menu = QMenu(menu_name, parent)
+            # Actions are built when the menu is first opened. Menus with shortcuts
+            # are built now: a shortcut only works once its action exists.
+            if any(entry and entry[2] for entry in actions):
+                UIFactory._populate_menu(menu, actions, parent)
+            else:
+                UIFactory._populate_on_first_show(menu, actions, parent)
+            add_menu(menu)
 
-            for action_entry in actions:
-                # Handle separators
-                if action_entry is None:
-                    menu.addSeparator()
-                    continue
+        return menubar
 
-                # Validate action entry format
-                if not isinstance(action_entry, (list, tuple)) or len(action_entry) < 2:
-                    raise ValueError(f"Invalid action entry format: {action_entry}")
+    @staticmethod
+    def _populate_menu(menu: QMenu, actions: list, parent: QWidget) -> None:
+        """Add normalized action entries (see `_normalize_actions`) to `menu`."""
+        add_action = menu.addAction
+        for action_entry in actions:
+            # Handle separators
+            if action_entry is None:
+                menu.addSeparator()
+                continue
 
-                try:
-                    text, callback, *rest = action_entry
-                    shortcut = rest[0] if rest else None
+            text, callback, shortcut = action_entry
+            action = QAction(text, parent)
+            if shortcut:
+                action.setShortcut(_key_sequence(shortcut))
+            if callback:
+                action.triggered.connect(callback)
+            add_action(action)
 
-                    if not isinstance(text, str):
-                        raise ValueError(f"Action text must be string, got {type(text)}")
+    @staticmethod
+    def _populate_on_first_show(menu: QMenu, actions: list, parent: QWidget) -> None:
+        """Populate `menu` from its `aboutToShow` signal, once."""
+        def populate():
+            menu.aboutToShow.disconnect(populate)
+            UIFactory._populate_menu(menu, actions, parent)
 
-                    action = QAction(text, parent)
+        menu.aboutToShow.connect(populate)
 
-                    if shortcut:
-                        if not isinstance(shortcut, str):
-                            raise ValueError(f"Shortcut must be string, got {type(shortcut)}")
-                        action.setShortcut(shortcut)
+    @staticmethod
+    def _normalize_actions(actions: list) -> list:
+        """
+        Validate menu action entries and normalize them to `(text, callback, shortcut)`.
 
-                    if callback:
-                        if not callable(callback):
-                            raise ValueError(f"Callback must be callable, got {type(callback)}")
-                        action.triggered.connect(callback)
+        Separators (None) are kept as is.
 
-                    menu.addAction(action)
+        :raises ValueError: If an entry format is invalid
+        """
+        normalized = []
+        for action_entry in actions:
+            if action_entry is None:
+                normalized.append(None)
+                continue
 
-                except (ValueError, TypeError) as e:
-                    raise ValueError(f"Error processing action entry {action_entry}: {e}")
+            # Validate action entry format
+            if not isinstance(action_entry, (list, tuple)) or len(action_entry) < 2:
+                raise ValueError(f"Invalid action entry format: {action_entry}")
 
-            menubar.addMenu(menu)
+            try:
+                text, callback, *rest = action_entry
+                shortcut = rest[0] if rest else None
 
-        return menubar
+                if not isinstance(text, str):
+                    raise ValueError(f"Action text must be string, got {type(text)}")
+                if shortcut and not isinstance(shortcut, str):
+                    raise ValueError(f"Shortcut must be string, got {type(shortcut)}")
+                if callback and not callable(callback):
+                    raise ValueError(f"Callback must be callable, got {type(callback)}")
+
+            except (ValueError, TypeError) as e:
+                raise ValueError(f"Error processing action entry {action_entry}: {e}")
+
+            normalized.append((text, callback, shortcut))
+        return normalized
 
     @staticmethod
     def create_drag_drop_area(width: int, height: int, allowed_extensions: list = None,
                               on_files_selected: callable = None) -> QWidget:
         """
-        Creates a widget area that supports drag and drop file operations.
+        Creates a widget area that supports click-to-browse and drag-and-drop of files.
 
         :param width: Width of the drag-drop area
         :param height: Height of the drag-drop area
         :param allowed_extensions: List of allowed file extensions (e.g. ['.txt', '.pdf'])
         :param on_files_selected Callback function called with list of file paths
 
-        :returns: Configured drag and drop area widget
-
-        Note:
-            This is a stub implementation. Actual drag-drop functionality needs to be implemented
-            by subclassing QWidget and implementing dragEnterEvent and dropEvent.
-
-        Example:
-            >>> drop_area = UIFactory.create_drag_drop_area(
-            ...     400, 200, ['.jpg', '.png'], self.handle_dropped_files
-            ... )
+        :returns: Configured drag and drop area widget (see `DragDrop`)
         """
-        pass
+        return DragDrop().create_drag_drop_area(width, height, allowed_extensions, on_files_selected)
 
     @staticmethod
     def create_file_entry(file_path, on_edit=None, on_delete=None, parent=None):
-        return FileEntry(file_path, on_edit, on_delete, parent)
\ No newline at end of file
+        return FileEntry(file_path, on_edit, on_delete, parent)
+
+    @staticmethod
+    def create_file_list(paths=None, on_edit=None, on_delete=None, parent=None):
+        """
+        Creates a list view showing files like `create_file_entry` rows.
+
+        Prefer it over one `FileEntry` per file for long lists: rows are painted
+        on demand by a delegate instead of each being a widget tree.
+        Add files with `view.file_model.add_files(paths)`.
+        """
+        return FileListView(paths, on_edit, on_delete, parent)
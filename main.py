@@ -1,7 +1,12 @@
 import sys
 from PySide6.QtWidgets import QApplication
 from core.config.configuration import Config
-from gui.main_window import MainWindow
+
+# Compiled Qt resources (icons); only generated by the PyInstaller build
+try:
+    import resources_rc  # noqa: F401
+except ImportError:
+    pass
 
 
 def main():
@@ -10,6 +15,8 @@ def main():
     config = Config.get()
     # 2️ Initialize the QApplication
     app = QApplication(sys.argv)
+    # 3️ Import the UI (all widget modules) only once the application exists
+    from gui.main_window import MainWindow
     # 4️ Create and show the main window
     window = MainWindow(config)
     window.show()
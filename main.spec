@@ -5,6 +5,8 @@ import PySide6
 import os
 import toml
 import ast
+import json
+import subprocess
 
 # --- Paths ---
 project_root = Path(os.getcwd())
@@ -51,6 +53,7 @@ datas = [
 ]
 
 # Add ONLY the specific resource subfolders from config (not the base folder)
+resource_manifest = {}  # {kind: [paths relative to the kind folder]}, read by Resources
 for key, path in resources_cfg.items():
     if key == "base":
         continue  # Skip base to avoid duplication
@@ -58,10 +61,28 @@ for key, path in resources_cfg.items():
     abs_path = project_root / path
     if abs_path.exists() and abs_path.is_dir():
         print(f"[INFO] Including resource folder: {path}")
+        files = resource_manifest.setdefault(key, [])
         for file_path in abs_path.rglob("*"):
             if file_path.is_file():
                 rel_path = file_path.relative_to(project_root)
                 datas.append((str(file_path), str(rel_path.parent)))
+                files.append(file_path.relative_to(abs_path).as_posix())
+
+# --- Resource manifest (lets the bundled app skip walking its resources) ---
+manifest_path = project_root / "build" / "resource_manifest.json"
+manifest_path.parent.mkdir(parents=True, exist_ok=True)
+manifest_path.write_text(json.dumps(resource_manifest), encoding="utf-8")
+datas.append((str(manifest_path), "resources"))
+
+# --- Qt resources (icons served from memory as ":/icons/...", see resources.qrc) ---
+build_dir = project_root / "build"
+qrc_path = project_root / "resources.qrc"
+if qrc_path.exists():
+    subprocess.run(
+        ["pyside6-rcc", str(qrc_path), "-o", str(build_dir / "resources_rc.py")],
+        check=True,
+    )
+    hiddenimports.append("resources_rc")
 
 # --- Include PySide6 dependencies (plugins, translations, etc.) ---
 for mod in used_modules:
@@ -71,7 +92,7 @@ for mod in used_modules:
 # --- Analysis phase ---
 a = Analysis(
     ['main.py'],
-    pathex=[str(project_root)],
+    pathex=[str(project_root), str(build_dir)],
     binaries=[],
     datas=datas,
     hiddenimports=hiddenimports,
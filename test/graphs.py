@@ -2,76 +2,104 @@ import sys
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QWidget, QCheckBox, QHBoxLayout
 )
-import pandas as pd
+import numpy as np
 import pyqtgraph as pg
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.pyplot as plt
-
-# Sample data
-df = pd.DataFrame({
-    "HRV": [70, 65, 80, 75, 60],
-    "BPM": [120, 130, 110, 125, 140],
-    "HRV_2": [68, 66, 79, 74, 62],
-    "BPM_2": [118, 132, 108, 127, 138],
+
+# Sample data (numeric columns as float64 arrays, handed to the plots as is)
+data = {
+    "HRV": np.array([70, 65, 80, 75, 60], np.float64),
+    "BPM": np.array([120, 130, 110, 125, 140], np.float64),
+    "HRV_2": np.array([68, 66, 79, 74, 62], np.float64),
+    "BPM_2": np.array([118, 132, 108, 127, 138], np.float64),
     "Micronutrient": ["Vitamin C", "Iron", "Calcium", "Vitamin D", "Magnesium"],
-    "Value": [20, 15, 25, 10, 30]
-})
+    "Value": np.array([20, 15, 25, 10, 30], np.float64),
+}
+
+# Draw plots through OpenGL when PyOpenGL is installed (symbols are filled on the
+# GPU); otherwise pyqtgraph keeps its default raster painting
+try:
+    import OpenGL  # noqa: F401
+    pg.setConfigOptions(useOpenGL=True, antialias=False)
+except ImportError:
+    pass
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Health Data Demo with Clickable Pie Chart")
         central = QWidget()
-        layout = QVBoxLayout()
+        self.main_layout = layout = QVBoxLayout()
         central.setLayout(layout)
         self.setCentralWidget(central)
+        add_widget, add_layout = layout.addWidget, layout.addLayout
 
         # --- PyQtGraph scatter plot ---
         self.scatter_plot = pg.PlotWidget(title="HRV vs BPM")
         self.scatter_plot.setBackground('w')
         self.scatter_plot.addLegend()
-        layout.addWidget(self.scatter_plot)
+        add_widget(self.scatter_plot)
+
+        # Scatter data as float64 arrays: pyqtgraph copies them as buffers
+        self.hrv, self.bpm = data["HRV"], data["BPM"]
+        self.hrv_2, self.bpm_2 = data["HRV_2"], data["BPM_2"]
 
         # Scatter plot items
         self.series1 = self.scatter_plot.plot(
-            df["HRV"], df["BPM"], pen=None, symbol='o', symbolBrush='r', name='Series 1'
+            self.hrv, self.bpm, pen=None, symbol='o', symbolBrush='r', name='Series 1'
         )
         self.series2 = self.scatter_plot.plot(
-            df["HRV_2"], df["BPM_2"], pen=None, symbol='t', symbolBrush='b', name='Series 2'
+            self.hrv_2, self.bpm_2, pen=None, symbol='t', symbolBrush='b', name='Series 2'
         )
 
         # Zoom / pan restriction
         self.scatter_plot.setLimits(xMin=50, xMax=100, yMin=100, yMax=150)
 
         # --- Legend / checkboxes to show/hide series ---
+        # `toggled` carries the checked state as a bool, so it drives setVisible directly
         checkbox_layout = QHBoxLayout()
-        layout.addLayout(checkbox_layout)
+        add_layout(checkbox_layout)
+        add_checkbox = checkbox_layout.addWidget
         self.checkbox1 = QCheckBox("Show Series 1")
         self.checkbox1.setChecked(True)
-        self.checkbox1.stateChanged.connect(self.toggle_series1)
-        checkbox_layout.addWidget(self.checkbox1)
+        self.checkbox1.toggled.connect(self.series1.setVisible)
+        add_checkbox(self.checkbox1)
 
         self.checkbox2 = QCheckBox("Show Series 2")
         self.checkbox2.setChecked(True)
-        self.checkbox2.stateChanged.connect(self.toggle_series2)
-        checkbox_layout.addWidget(self.checkbox2)
+        self.checkbox2.toggled.connect(self.series2.setVisible)
+        add_checkbox(self.checkbox2)
 
         # --- Matplotlib pie chart with clickable slices ---
+        # Built on first show (see showEvent): matplotlib is only loaded then
+        self._pie_initialized = False
+        self.pie_placeholder = QWidget()
+        add_widget(self.pie_placeholder)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._pie_initialized:
+            self._pie_initialized = True
+            self.initialize_pie_chart()
+
+    def initialize_pie_chart(self):
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        import matplotlib.pyplot as plt
+
         self.fig, self.ax = plt.subplots()
         self.canvas = FigureCanvas(self.fig)
-        layout.addWidget(self.canvas)
+        self.main_layout.replaceWidget(self.pie_placeholder, self.canvas)
+        self.pie_placeholder.deleteLater()
+        # Connect click event (once, not on every redraw)
+        self.fig.canvas.mpl_connect('pick_event', self.on_slice_click)
         self.draw_pie_chart()
 
     def draw_pie_chart(self):
         self.ax.clear()
-        wedges, texts, autotexts = self.ax.pie(
-            df["Value"], labels=df["Micronutrient"], autopct='%1.1f%%', startangle=90
+        # Wedges are created pickable (wedgeprops), no per-wedge pass afterwards
+        self.ax.pie(
+            data["Value"], labels=data["Micronutrient"], autopct='%1.1f%%', startangle=90,
+            wedgeprops={"picker": True}
         )
-        # Make wedges pickable
-        for wedge in wedges:
-            wedge.set_picker(True)
-        # Connect click event
-        self.fig.canvas.mpl_connect('pick_event', self.on_slice_click)
         self.canvas.draw()
 
     def on_slice_click(self, event):
@@ -79,13 +107,6 @@ class MainWindow(QMainWindow):
         label = wedge.get_label() if hasattr(wedge, 'get_label') else 'Unknown'
         print(f"Clicked on slice: {label}")
 
-    # Toggle visibility functions
-    def toggle_series1(self, state):
-        self.series1.setVisible(state == 2)
-
-    def toggle_series2(self, state):
-        self.series2.setVisible(state == 2)
-
 app = QApplication(sys.argv)
 window = MainWindow()
 window.show()